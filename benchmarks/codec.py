@@ -0,0 +1,54 @@
+# Decoding and encoding a large MediaListCollection response with every available codec,
+# next to the bytes -> str -> json.loads round trip of aiohttp's `response.json()` that the
+# codecs replaced.
+#
+#   python benchmarks/codec.py [--entries 500] [--repeat 10]
+from typing import Any, Callable, List
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from miku.codec import JSONCodec, OrjsonCodec, StdlibJSONCodec, UjsonCodec
+from payloads import media_list_collection
+
+def best(func: Callable[[], Any], repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='JSON codec throughput on a large response.')
+    parser.add_argument('--entries', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    body = media_list_collection(args.entries)
+    raw = StdlibJSONCodec().encode(body)
+    print(f'MediaListCollection, {args.entries} entries, {len(raw) / 1e6:.1f} MB; best of {args.repeat}')
+
+    aiohttp = best(lambda: json.loads(raw.decode('utf-8')), args.repeat)
+    print(f'  {"response.json()":16} decode {aiohttp * 1e3:8.1f} ms')
+
+    codecs: List[JSONCodec] = [StdlibJSONCodec()]
+    for codec in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec())
+        except RuntimeError:
+            print(f'  {codec.__name__:16} not installed')
+
+    for codec in codecs:
+        decode = best(lambda: codec.decode(raw), args.repeat)
+        encode = best(lambda: codec.encode(body), args.repeat)
+
+        print(f'  {codec.name:16} decode {decode * 1e3:8.1f} ms   encode {encode * 1e3:8.1f} ms')
+
+if __name__ == '__main__':
+    main()
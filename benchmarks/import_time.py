@@ -0,0 +1,73 @@
+# Measures a bare `import miku` with `python -X importtime` and fails when it regresses:
+# the import must not pull in aiohttp, and its cumulative time must stay within `--budget`
+# times that of `import typing`, measured the same way in the same run. miku needs typing
+# anyway, so the budget holds on fast and slow machines alike.
+#
+#   python benchmarks/import_time.py [--runs 5] [--budget 2]
+from typing import List, Tuple
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure(module: str) -> Tuple[float, bool]:
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')]))}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import sys, {module}; print("aiohttp" in sys.modules)'],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        check=True
+    )
+
+    # Lines look like "import time:       123 |       4567 | miku", self and cumulative in us.
+    cumulative = None
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative = int(parts[1]) / 1000
+
+    if cumulative is None:
+        raise RuntimeError(f'{module} does not show up in the -X importtime output')
+
+    return cumulative, result.stdout.strip() == 'True'
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Import time of the miku package.')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=2, help='maximum cumulative time, in multiples of typing')
+    args = parser.parse_args()
+
+    timings: List[float] = []
+    baselines: List[float] = []
+    loads_aiohttp = False
+    for _ in range(args.runs):
+        cumulative, aiohttp = measure('miku')
+        baseline, _ = measure('typing')
+
+        timings.append(cumulative)
+        baselines.append(baseline)
+        loads_aiohttp = loads_aiohttp or aiohttp
+
+    best = min(timings)
+    threshold = min(baselines) * args.budget
+
+    print(f'import miku: best {best:.1f} ms, worst {max(timings):.1f} ms over {args.runs} runs')
+    print(f'import typing: best {min(baselines):.1f} ms, threshold {threshold:.1f} ms at a budget of {args.budget:g}x')
+
+    failed = False
+    if loads_aiohttp:
+        print('FAIL: import miku loads aiohttp')
+        failed = True
+
+    if best > threshold:
+        print(f'FAIL: {best:.1f} ms is over the threshold of {threshold:.1f} ms')
+        failed = True
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,53 @@
+# Memory held by hydrated Media objects once the response itself has been dropped, with and
+# without `retain_payload`, measured with tracemalloc. The third row keeps the payloads and
+# touches the derived properties, the way templates would.
+#
+#   python benchmarks/payload_memory.py [--count 10000]
+from typing import Any, List
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import miku
+from miku.http import HTTPHandler
+from payloads import media
+
+def hydrate(raw: bytes, retain_payload: bool, access: bool) -> float:
+    http = HTTPHandler(asyncio.get_running_loop(), retain_payload=retain_payload)
+
+    gc.collect()
+    tracemalloc.start()
+
+    objects: List[Any] = [http.hydrate(miku.Media, payload) for payload in json.loads(raw)]
+    if access:
+        for obj in objects:
+            obj.title, obj.tags, obj.rankings, obj.characters, obj.cover, obj.trailer, obj.type, obj.format, obj.status
+
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del objects
+    return current / 2 ** 20
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Memory held by hydrated Media objects.')
+    parser.add_argument('--count', type=int, default=10000)
+    args = parser.parse_args()
+
+    # Serialized up front so that every run decodes its own copy, like a real response.
+    raw = json.dumps([media(index) for index in range(args.count)]).encode()
+
+    print(f'{args.count} Media (10 characters, 2 studios, 10 tags, 4 rankings each), live after the response is dropped')
+    print(f'  retain_payload=True                         {hydrate(raw, True, False):8.1f} MiB')
+    print(f'  retain_payload=True, properties accessed    {hydrate(raw, True, True):8.1f} MiB')
+    print(f'  retain_payload=False                        {hydrate(raw, False, False):8.1f} MiB')
+
+if __name__ == '__main__':
+    asyncio.run(main())
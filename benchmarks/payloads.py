@@ -0,0 +1,127 @@
+# Synthetic AniList payloads shaped like the responses to the full field presets, shared by
+# the benchmarks.
+from typing import Any, Dict
+
+def character(id: int, *, description: int = 200) -> Dict[str, Any]:
+    return {
+        '__typename': 'Character',
+        'id': id,
+        'description': 'x' * description,
+        'gender': 'Female',
+        'age': '17',
+        'siteUrl': f'https://anilist.co/character/{id}',
+        'favourites': 10,
+        'name': {'first': 'a', 'middle': None, 'last': 'b', 'full': 'a b', 'native': 'ネイティブ', 'alternative': ['x']},
+        'image': {'large': 'https://l', 'medium': 'https://m'},
+        'dateOfBirth': {'year': None, 'month': 1, 'day': 2},
+    }
+
+def tag(id: int) -> Dict[str, Any]:
+    return {
+        'id': id,
+        'name': f'tag{id}',
+        'description': 'tag description',
+        'category': 'Theme',
+        'rank': 80,
+        'isGeneralSpoiler': False,
+        'isMediaSpoiler': False,
+        'isAdult': False,
+        'userId': None,
+    }
+
+def ranking(id: int) -> Dict[str, Any]:
+    return {
+        'id': id,
+        'rank': id,
+        'year': 2020,
+        'format': 'TV',
+        'type': 'RATED',
+        'season': 'FALL',
+        'allTime': False,
+        'context': 'highest rated',
+    }
+
+def media(
+    id: int, *, characters: int = 10, tags: int = 10, rankings: int = 4, description: int = 1000
+) -> Dict[str, Any]:
+    return {
+        '__typename': 'Media',
+        'id': id,
+        'idMal': id,
+        'siteUrl': f'https://anilist.co/anime/{id}',
+        'averageScore': 50,
+        'meanScore': 50,
+        'isLicensed': True,
+        'genres': ['Action', 'Drama'],
+        'trending': 1,
+        'isAdult': False,
+        'synonyms': ['a', 'b'],
+        'description': 'd' * description,
+        'hashtag': None,
+        'popularity': 1,
+        'favourites': 1,
+        'type': 'ANIME',
+        'format': 'TV',
+        'season': 'FALL',
+        'status': 'FINISHED',
+        'source': 'ORIGINAL',
+        'duration': 24,
+        'chapters': None,
+        'volumes': None,
+        'episodes': 12,
+        'updatedAt': 0,
+        'title': {'romaji': f'media {id}', 'english': None, 'native': 'ネイティブ'},
+        'tags': [tag(index) for index in range(tags)],
+        'trailer': {'id': 'abc', 'site': 'youtube', 'thumbnail': 'https://t'},
+        'nextAiringEpisode': None,
+        'streamingEpisodes': [],
+        'rankings': [ranking(index) for index in range(rankings)],
+        'bannerImage': None,
+        'coverImage': {'large': 'https://l', 'medium': 'https://m'},
+        'characters': {'nodes': [character(id * 100 + index) for index in range(characters)]},
+        'studios': {
+            'nodes': [
+                {'__typename': 'Studio', 'id': index, 'name': 's', 'siteUrl': 'u', 'isAnimationStudio': True, 'favourites': 1}
+                for index in range(2)
+            ]
+        },
+    }
+
+def media_list_collection(entries: int, *, characters: int = 25) -> Dict[str, Any]:
+    return {
+        'data': {
+            'MediaListCollection': {
+                'hasNextChunk': False,
+                'lists': [{
+                    'name': 'Completed',
+                    'isCustomList': False,
+                    'isSplitCompletedList': False,
+                    'status': 'COMPLETED',
+                    'entries': [
+                        {
+                            'id': index,
+                            'userId': 1,
+                            'mediaId': index,
+                            'status': 'COMPLETED',
+                            'score': 8,
+                            'progress': 12,
+                            'progressVolumes': 0,
+                            'repeat': 0,
+                            'notes': None,
+                            'private': False,
+                            'priority': 0,
+                            'hiddenFromStatusLists': False,
+                            'customLists': None,
+                            'advancedScores': {},
+                            'updatedAt': 0,
+                            'createdAt': 0,
+                            'startedAt': {'year': 2020, 'month': 1, 'day': 1},
+                            'completedAt': {'year': 2020, 'month': 2, 'day': 1},
+                            'media': media(index, characters=characters, description=1500),
+                        }
+                        for index in range(entries)
+                    ],
+                }],
+            }
+        }
+    }
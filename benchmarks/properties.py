@@ -0,0 +1,68 @@
+# Attribute access on model properties memoized with cached_slot_property. "computed" calls
+# the function behind the property, which is what every access used to cost, and "cached"
+# is the memoized access after the first one.
+#
+#   python benchmarks/properties.py [--number 200000]
+from typing import Any, Callable, List, Tuple
+import argparse
+import asyncio
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import miku
+from miku.http import HTTPHandler
+from payloads import character, media
+
+def per_access(func: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Cost of accessing memoized model properties.')
+    parser.add_argument('--number', type=int, default=200000)
+    args = parser.parse_args()
+
+    http = HTTPHandler(asyncio.get_running_loop())
+
+    anime = http.hydrate(miku.Media, media(1))
+    char = http.hydrate(miku.Character, character(1))
+    staff = http.hydrate(miku.Staff, {**character(2), '__typename': 'Staff'})
+    user = http.hydrate(miku.User, {
+        'id': 1,
+        'name': 'user',
+        'options': {
+            'titleLanguage': 'ROMAJI',
+            'displayAdultContent': False,
+            'airingNotifications': True,
+            'profileColor': 'blue',
+            'notificationOptions': [],
+        },
+    })
+
+    # (label, object, property, what is read off the property's value)
+    cases: List[Tuple[str, Any, str, Callable[[Any], Any]]] = [
+        ('media.title.romaji', anime, 'title', lambda title: title.romaji),
+        ('media.type', anime, 'type', lambda value: value),
+        ('media.status', anime, 'status', lambda value: value),
+        ('media.tags (10 tags)', anime, 'tags', lambda value: value),
+        ('media.cover', anime, 'cover', lambda value: value),
+        ('character.name.full', char, 'name', lambda name: name.full),
+        ('staff.name.full', staff, 'name', lambda name: name.full),
+        ('user.options', user, 'options', lambda value: value),
+    ]
+
+    print(f'ns per access, best of 5 x {args.number}')
+    print(f'  {"":22} {"computed":>9} {"cached":>9}')
+
+    for label, obj, name, read in cases:
+        func = getattr(type(obj), name).func
+
+        computed = per_access(lambda: read(func(obj)), args.number)
+        cached = per_access(lambda: read(getattr(obj, name)), args.number)
+
+        print(f'  {label:22} {computed * 1e9:9.0f} {cached * 1e9:9.0f}')
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+# CPU spent producing the query document of a request, with the network mocked out.
+# "memoized" is what a get_* call costs now: finding the already built document and
+# preparing the variables. "rebuilt" builds and serializes the same documents from the
+# field tuples on every call, which is what each request used to pay. The bulk getters
+# also go through fetch_chunks, so their memoized column includes scheduling the chunks.
+#
+#   python benchmarks/query_build.py [--calls 2000]
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+import argparse
+import asyncio
+import collections
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from miku.http import HTTPHandler
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Query document build time per request.')
+    parser.add_argument('--calls', type=int, default=2000)
+    args = parser.parse_args()
+
+    http = HTTPHandler(asyncio.get_running_loop())
+    built: List[Tuple[str, Tuple[Any, ...]]] = []
+    builders: List[str] = []
+
+    async def request(query: Any, rtype: Any = None, **variables: Any) -> Dict[str, Any]:
+        query.compile()
+        # Every bulk chunk comes back empty.
+        return collections.defaultdict(list)
+
+    http.request = request # type: ignore
+
+    async def paginate(paginator: Any) -> None:
+        paginator.query.compile()
+
+    calls: List[Tuple[str, Callable[[], Awaitable[Any]]]] = [
+        ('get_media', lambda: http.get_media(1, 'ANIME')),
+        ('get_character', lambda: http.get_character('Miku')),
+        ('get_user', lambda: http.get_user(1)),
+        ('get_staff', lambda: http.get_staff(1)),
+        ('get_medias', lambda: paginate(http.get_medias('Miku', 'ANIME'))),
+        ('get_users', lambda: paginate(http.get_users('Miku'))),
+        ('get_characters', lambda: paginate(http.get_characters('Miku'))),
+        ('get_many, 50 media', lambda: http.get_many('media', 'Media', range(50), concurrency=1)),
+        ('get_users_many, 25 users', lambda: http.get_users_many(range(25), concurrency=1)),
+    ]
+
+    # Records which memoized builder each call goes through, to rebuild the same documents.
+    # Removed again once every call was recorded so that it isn't part of the timings.
+    for name in dir(HTTPHandler):
+        builder = getattr(HTTPHandler, name)
+        if hasattr(builder, '__wrapped__'):
+            def record(*arguments: Any, name: str = name, builder: Callable[..., Any] = builder) -> Any:
+                built.append((name, arguments))
+                return builder(http, *arguments)
+
+            setattr(http, name, record)
+            builders.append(name)
+
+    documents: List[List[Tuple[str, Tuple[Any, ...]]]] = []
+    for _, call in calls:
+        await call()
+        documents.append(built.copy())
+        built.clear()
+
+    for name in builders:
+        delattr(http, name)
+
+    print(f'us per request, {args.calls} calls each; full presets')
+    print(f'  {"":26} {"rebuilt":>8} {"memoized":>9}')
+
+    for (label, call), rebuilds in zip(calls, documents):
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            await call()
+
+        memoized = (time.perf_counter() - start) / args.calls
+
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            for name, arguments in rebuilds:
+                getattr(HTTPHandler, name).__wrapped__(http, *arguments).build()
+
+        rebuilt = (time.perf_counter() - start) / args.calls
+
+        print(f'  {label:26} {rebuilt * 1e6:8.1f} {memoized * 1e6:9.1f}')
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+# Serializing every query document HTTPHandler builds. "concatenated" builds each node's
+# string out of its children's, the way the serializer used to, "buffer" is the single pass
+# of Query.build() and "compiled" is Query.compile() once the document is interned.
+#
+#   python benchmarks/serializer.py [--number 2000]
+from typing import Any, Callable, Dict, List, Tuple
+import argparse
+import asyncio
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from miku.http import HTTPHandler
+from miku.query import Query, QueryField, QueryFields, QueryFragment
+
+def arguments(values: Dict[str, Any]) -> str:
+    return '(' + ', '.join([f'{key}: {value}' for key, value in values.items()]) + ')'
+
+def concatenated(element: Any) -> str:
+    if isinstance(element, Query):
+        roots = ' '.join([concatenated(root) for root in element.roots])
+        document = element.operation.type
+        if element.operation.variables:
+            document += ' ' + arguments(element.operation.variables)
+
+        document += ' { ' + roots + ' }'
+        for fragment in element.fragments.values():
+            document += ' ' + concatenated(fragment)
+
+        return document
+
+    if isinstance(element, QueryFragment):
+        return f'fragment {element.name} on {element.type} ' + '{ ' + ' '.join([concatenated(field) for field in element.fields]) + ' }'
+
+    text = element.name
+    if isinstance(element, QueryFields) and element.alias:
+        text = f'{element.alias}: {text}'
+
+    if element.arguments:
+        text += ' ' + arguments(element.arguments)
+
+    if isinstance(element, QueryField):
+        for name, values in element.directives.items():
+            text += f' @{name}' + (arguments(values) if values else '')
+
+    if element.fields:
+        text += ' { ' + ' '.join([concatenated(field) for field in element.fields]) + ' }'
+    elif isinstance(element, QueryField) and element.items:
+        text += ' { ' + ' '.join(element.items) + ' }'
+
+    return text
+
+def per_call(func: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Query serialization time for every document HTTPHandler builds.')
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+
+    http = HTTPHandler(asyncio.get_running_loop())
+
+    def selection(type: str) -> Tuple[Any, ...]:
+        return http.select(type, 'full')[0]
+
+    cases: Dict[str, Tuple[Any, ...]] = {
+        'media_tag_collection_query': (),
+        'genre_collection_query': (),
+        'thread_query': (),
+        'thread_comment_query': (),
+        'user_query': (selection('User'),),
+        'viewer_query': (selection('User'),),
+        'media_query': (selection('Media'),),
+        'media_trend_query': (),
+        'studio_query': (selection('Studio'),),
+        'staff_query': (selection('Staff'),),
+        'site_statistics_query': (),
+        'character_query': (selection('Character'),),
+        'users_query': (selection('User'),),
+        'medias_query': (selection('Media'),),
+        'characters_query': (selection('Character'),),
+        'bulk_query': ('media', selection('Media')),
+        'bulk_users_query': (25, selection('User')),
+        'media_list_collection_query': (),
+    }
+
+    # Every memoized builder on the handler has to be covered.
+    builders = {name for name in dir(HTTPHandler) if hasattr(getattr(HTTPHandler, name), '__wrapped__')}
+    missing = builders - cases.keys()
+    if missing:
+        raise SystemExit(f'No case for {", ".join(sorted(missing))}')
+
+    print(f'us per document, best of 5 x {args.number}; full presets')
+    print(f'  {"":28} {"chars":>6} {"concatenated":>13} {"buffer":>8} {"compiled":>9}')
+
+    totals: List[float] = [0, 0, 0]
+    for name, values in cases.items():
+        query: Query = getattr(HTTPHandler, name).__wrapped__(http, *values)
+        query.compile()
+
+        timings = [
+            per_call(lambda: concatenated(query), args.number),
+            per_call(query.build, args.number),
+            per_call(query.compile, args.number),
+        ]
+
+        for index, timing in enumerate(timings):
+            totals[index] += timing
+
+        concat, buffer, compiled = timings
+        print(f'  {name:28} {len(query.build()):6} {concat * 1e6:13.1f} {buffer * 1e6:8.1f} {compiled * 1e6:9.2f}')
+
+    concat, buffer, compiled = totals
+    print(f'  {"total":28} {"":6} {concat * 1e6:13.1f} {buffer * 1e6:8.1f} {compiled * 1e6:9.2f}')
+
+if __name__ == '__main__':
+    asyncio.run(main())
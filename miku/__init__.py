@@ -1,17 +1,127 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List
+import importlib
+
 __author__ = 'blanketsucks'
 __version__ = '1.0.0'
 
-from .character import *
-from .client import *
-from .common import *
-from .enums import *
-from .errors import *
-from .image import *
-from .media import *
-from .staff import *
-from .statistics import *
-from .studio import *
-from .threads import *
-from .user import *
-
-from . import fields, http, query, utils, types, paginator
\ No newline at end of file
+# The client pulls in aiohttp, which is most of what `import miku` used to cost, so
+# submodules are only imported the first time one of their names is looked up.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    'DEFAULT_CACHE_TTLS': 'cache',
+    'CacheStats': 'cache',
+    'AbstractCache': 'cache',
+    'MemoryCache': 'cache',
+    'SQLiteCache': 'cache',
+    'Character': 'character',
+    'AnilistClient': 'client',
+    'JSONCodec': 'codec',
+    'StdlibJSONCodec': 'codec',
+    'OrjsonCodec': 'codec',
+    'UjsonCodec': 'codec',
+    'get_default_codec': 'codec',
+    'Name': 'common',
+    'FuzzyDate': 'common',
+    'MediaFormat': 'enums',
+    'MediaStatus': 'enums',
+    'MediaType': 'enums',
+    'MediaSource': 'enums',
+    'MediaSeason': 'enums',
+    'MediaSort': 'enums',
+    'CharacterSort': 'enums',
+    'UserSort': 'enums',
+    'UserTitleLanguage': 'enums',
+    'UserNotificationOptionType': 'enums',
+    'ScoreFormat': 'enums',
+    'ModeratorRole': 'enums',
+    'MediaListStatus': 'enums',
+    'HTTPException': 'errors',
+    'Forbidden': 'errors',
+    'BadRequest': 'errors',
+    'NotFound': 'errors',
+    'TooManyRequests': 'errors',
+    'AniListServerError': 'errors',
+    'IdentityMap': 'identity',
+    'Image': 'image',
+    'MediaTitle': 'media',
+    'MediaTrailer': 'media',
+    'MediaTag': 'media',
+    'MediaAiringSchedule': 'media',
+    'MediaStreamingEpisode': 'media',
+    'MediaTrend': 'media',
+    'MediaRank': 'media',
+    'Media': 'media',
+    'Manga': 'media',
+    'Anime': 'media',
+    'RetryBudget': 'retry',
+    'RetryPolicy': 'retry',
+    'Staff': 'staff',
+    'SiteTrend': 'statistics',
+    'SiteStatistics': 'statistics',
+    'ENTITY_TYPES': 'store',
+    'EntityStore': 'store',
+    'Studio': 'studio',
+    'ThreadCategory': 'threads',
+    'ThreadComment': 'threads',
+    'Thread': 'threads',
+    'MediaListTypeOptions': 'user',
+    'MediaListOptions': 'user',
+    'MediaList': 'user',
+    'MediaListGroup': 'user',
+    'UserNotificationOption': 'user',
+    'UserOptions': 'user',
+    'UserFavourites': 'user',
+    'User': 'user',
+}
+
+_LAZY_SUBMODULES = (
+    'fields',
+    'http',
+    'query',
+    'utils',
+    'types',
+    'paginator',
+    'ratelimit',
+    'batching',
+    'streaming',
+)
+
+__all__ = tuple(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .cache import *
+    from .character import *
+    from .client import *
+    from .codec import *
+    from .common import *
+    from .enums import *
+    from .errors import *
+    from .identity import *
+    from .image import *
+    from .media import *
+    from .retry import *
+    from .staff import *
+    from .statistics import *
+    from .store import *
+    from .studio import *
+    from .threads import *
+    from .user import *
+
+    from . import fields, http, query, utils, types, paginator, ratelimit, batching, streaming
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # Cached on the module so that later lookups never go through here again.
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES})
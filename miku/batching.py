@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+import asyncio
+import weakref
+
+from .query import MAX_QUERY_COMPLEXITY, Query, QueryField, QueryFields, QueryOperation
+from .errors import HTTPException, get_complexity_overrun
+
+if TYPE_CHECKING:
+    from .http import HTTPHandler
+
+__all__ = (
+    'RequestBatcher',
+)
+
+def _has_nested_variables(fields: List[QueryField]) -> bool:
+    for field in fields:
+        if any(isinstance(value, str) and value.startswith('$') for value in field.arguments.values()):
+            return True
+
+        if _has_nested_variables(field.fields):
+            return True
+
+    return False
+
+def _shared_variables(query: Query) -> List[str]:
+    # Variables only used by directives deeper in the tree, such as the `$full` switch of the
+    # presets. Those can't be renamed per root, so every request in a batch shares them.
+    operation: QueryOperation = query.operation # type: ignore
+    arguments = set(query.roots[0].arguments.values())
+
+    return [name[1:] for name in operation.variables if name not in arguments]
+
+class _PendingRequest:
+    __slots__ = ('query', 'variables', 'future')
+
+    def __init__(self, query: Query, variables: Dict[str, Any], future: asyncio.Future[Dict[str, Any]]) -> None:
+        self.query = query
+        self.variables = variables
+        self.future = future
+
+    def set_result(self, result: Dict[str, Any]) -> None:
+        if not self.future.done():
+            self.future.set_result(result)
+
+    def set_exception(self, exc: BaseException) -> None:
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+class RequestBatcher:
+    def __init__(self, http: HTTPHandler, *, window: float = 0.01, max_size: int = 10) -> None:
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+
+        self.http = http
+        self.window = window
+        self.max_size = max_size
+
+        self.pending: List[_PendingRequest] = []
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.tasks: Set[asyncio.Task[None]] = set()
+        self.batchable: weakref.WeakKeyDictionary[Query, bool] = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return f'<RequestBatcher window={self.window} max_size={self.max_size} pending={len(self.pending)}>'
+
+    def is_batchable(self, query: Query) -> bool:
+        batchable = self.batchable.get(query)
+        if batchable is None:
+            batchable = self.batchable[query] = self._is_batchable(query)
+
+        return batchable
+
+    def _is_batchable(self, query: Query) -> bool:
+        operation = query.operation
+        if operation is None or operation.type != 'query' or len(query.roots) != 1:
+            return False
+
+        # Only the root arguments get renamed when the query is aliased, so variables used as
+        # arguments deeper in the tree would end up undefined.
+        root = query.roots[0]
+        if root.alias:
+            return False
+
+        fragments = [fragment.fields for fragment in query.fragments.values()]
+        return not any(_has_nested_variables(fields) for fields in [root.fields, *fragments])
+
+    def submit(self, query: Query, variables: Dict[str, Any]) -> asyncio.Future[Dict[str, Any]]:
+        future: asyncio.Future[Dict[str, Any]] = self.http.loop.create_future()
+        self.pending.append(_PendingRequest(query, variables, future))
+
+        if len(self.pending) >= self.max_size:
+            self.flush()
+        elif self.handle is None:
+            self.handle = self.http.loop.call_later(self.window, self.flush)
+
+        return future
+
+    def flush(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+
+        task = self.http.loop.create_task(self.send(pending))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def drain(self) -> None:
+        self.flush()
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    def build(self, pending: List[_PendingRequest]) -> Tuple[Query, Dict[str, Any]]:
+        operation_variables: Dict[str, str] = {}
+        variables: Dict[str, Any] = {}
+        roots: List[QueryFields] = []
+
+        for index, request in enumerate(pending):
+            prefix = f'a{index}_'
+            root: QueryFields = request.query.roots[0]  # type: ignore
+            operation: QueryOperation = request.query.operation  # type: ignore
+            shared = _shared_variables(request.query)
+
+            for name, type in operation.variables.items():
+                if name[1:] in shared:
+                    operation_variables[name] = type
+                else:
+                    operation_variables['$' + prefix + name[1:]] = type
+
+            for name, value in request.variables.items():
+                if name in shared:
+                    variables[name] = value
+                else:
+                    variables[prefix + name] = value
+
+            arguments = {
+                key: '$' + prefix + value[1:] if isinstance(value, str) and value.startswith('$') else value
+                for key, value in root.arguments.items()
+            }
+
+            roots.append(QueryFields(root.name, root.fields, alias=f'a{index}', **arguments))
+
+        query = Query(operation=QueryOperation(type='query', variables=operation_variables))
+        for root in roots:
+            query.add_root(root)
+
+        # Fragments are named after the selection they stand for, so requests that share
+        # one also share its definition.
+        for request in pending:
+            for fragment in request.query.fragments.values():
+                query.add_fragment(fragment)
+
+        return query, variables
+
+    def split(self, pending: List[_PendingRequest]) -> List[List[_PendingRequest]]:
+        # Requests only end up in one document when they agree on the variables they share.
+        groups: List[List[_PendingRequest]] = []
+        for request in pending:
+            for group in groups:
+                if self._shares_variables(group[0], request):
+                    group.append(request)
+                    break
+            else:
+                groups.append([request])
+
+        return groups
+
+    def _shares_variables(self, first: _PendingRequest, second: _PendingRequest) -> bool:
+        names = {*_shared_variables(first.query), *_shared_variables(second.query)}
+        return all(first.variables.get(name) == second.variables.get(name) for name in names)
+
+    def pack(
+        self, pending: List[_PendingRequest], limit: int, ratio: Optional[float] = None
+    ) -> List[List[_PendingRequest]]:
+        # Consecutive requests go in one document for as long as their estimates, scaled by
+        # what AniList charged for their documents before, add up to no more than the limit.
+        # Documents AniList never rejected count as free, the estimate alone overshoots too
+        # much to be trusted.
+        chunks: List[List[_PendingRequest]] = []
+        chunk: List[_PendingRequest] = []
+        total = 0.0
+
+        for request in pending:
+            scale = ratio if ratio is not None else self.http.complexity_ratios.get(request.query)
+
+            cost = request.query.complexity(request.variables) * scale if scale is not None else 0
+            if chunk and total + cost > limit:
+                chunks.append(chunk)
+                chunk, total = [], 0.0
+
+            chunk.append(request)
+            total += cost
+
+        chunks.append(chunk)
+        return chunks
+
+    async def send(self, pending: List[_PendingRequest]) -> None:
+        groups = [chunk for group in self.split(pending) for chunk in self.pack(group, MAX_QUERY_COMPLEXITY)]
+        if len(groups) > 1:
+            await asyncio.gather(*[self.send_many(group) for group in groups])
+        else:
+            await self.send_many(pending)
+
+    async def send_many(self, pending: List[_PendingRequest]) -> None:
+        if len(pending) == 1:
+            return await self.send_one(pending[0])
+
+        query, variables = self.build(pending)
+        try:
+            data = await self.http.send(query, variables)
+        except HTTPException as exc:
+            overrun = get_complexity_overrun(exc)
+            if overrun is not None:
+                # Every request is charged what AniList says the whole document cost relative to
+                # its estimate, which both splits this batch and packs later ones holding the same
+                # documents before they are sent.
+                limit, cost = overrun
+                ratio = cost / query.complexity(variables)
+
+                for request in pending:
+                    self.http.complexity_ratios[request.query] = ratio
+
+                await asyncio.gather(*[self.send_many(chunk) for chunk in self.pack(pending, limit, ratio)])
+                return
+
+            # AniList fails the whole document if any root errors (e.g. a single unknown id),
+            # but still returns the roots that did resolve.
+            data = exc.data.get('data') if isinstance(exc.data, dict) else None
+            if not data:
+                data = {}
+        except asyncio.CancelledError:
+            for request in pending:
+                request.future.cancel()
+
+            raise
+        except Exception as exc:
+            for request in pending:
+                request.set_exception(exc)
+
+            return
+
+        retry: List[_PendingRequest] = []
+        for index, request in enumerate(pending):
+            result = data.get(f'a{index}')
+            if result is None:
+                retry.append(request)
+            else:
+                request.set_result({request.query.roots[0].name: result})
+
+        # Roots that came back empty are re-sent on their own so that each caller gets
+        # the exact response, or error, it would have gotten without batching.
+        if retry:
+            await asyncio.gather(*[self.send_one(request) for request in retry])
+
+    async def send_one(self, request: _PendingRequest) -> None:
+        try:
+            data = await self.http.send(request.query, request.variables)
+        except Exception as exc:
+            request.set_exception(exc)
+        else:
+            request.set_result(data)
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from abc import ABC, abstractmethod
+import functools
+import asyncio
+import hashlib
+import sqlite3
+import time
+
+__all__ = (
+    'DEFAULT_CACHE_TTLS',
+    'CacheStats',
+    'AbstractCache',
+    'MemoryCache',
+    'SQLiteCache',
+)
+
+T = TypeVar('T')
+
+# Seconds a response is kept for, keyed on the name of the query's root field.
+# Anything not listed here falls back to the `default_ttl` of the cache.
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    'GenreCollection': 86400,
+    'MediaTagCollection': 86400,
+    'SiteStatistics': 3600,
+    'Studio': 3600,
+    'Staff': 3600,
+    'Character': 3600,
+    'Media': 300,
+    'MediaTrend': 300,
+    'MediaListCollection': 60,
+    'Page': 60,
+    'Thread': 60,
+    'ThreadComment': 60,
+    'User': 60,
+    'Viewer': 30,
+}
+
+def make_cache_key(document: str, variables: str, token: Optional[str] = None) -> str:
+    # Hashed so that access tokens never end up stored in a cache backend as-is.
+    key = hashlib.sha256(document.encode())
+    key.update(b'\0' + variables.encode())
+    if token:
+        key.update(b'\0' + token.encode())
+
+    return key.hexdigest()
+
+class CacheStats:
+    __slots__ = ('hits', 'misses', 'evictions')
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f'<CacheStats hits={self.hits} misses={self.misses} evictions={self.evictions}>'
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class AbstractCache(ABC):
+    default_ttl: float = 60
+    stats: CacheStats
+
+    def get_ttl(self, name: str) -> float:
+        return DEFAULT_CACHE_TTLS.get(name, self.default_ttl)
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+class MemoryCache(AbstractCache):
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        default_ttl: float = 60,
+        ttls: Optional[Dict[str, float]] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+
+        self.entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self.size = 0
+        self.stats = CacheStats()
+
+    def __repr__(self) -> str:
+        return f'<MemoryCache entries={len(self.entries)} size={self.size} stats={self.stats!r}>'
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_ttl(self, name: str) -> float:
+        return self.ttls.get(name, self.default_ttl)
+
+    def _remove(self, key: str) -> None:
+        _, value = self.entries.pop(key)
+        self.size -= len(value)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.misses += 1
+
+            return None
+
+        self.entries.move_to_end(key)
+        self.stats.hits += 1
+
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if key in self.entries:
+            self._remove(key)
+
+        if len(value) > self.max_bytes:
+            return
+
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.size += len(value)
+
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self.entries)))
+            self.stats.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        if key in self.entries:
+            self._remove(key)
+
+    async def clear(self) -> None:
+        self.entries.clear()
+        self.size = 0
+
+class SQLiteCache(AbstractCache):
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS responses ('
+        'key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, '
+        'expires_at REAL NOT NULL, accessed_at REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)',
+        'CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)',
+        # Running totals of the table, kept up to date by triggers so that checking the limits
+        # on a write never has to scan it.
+        'CREATE TABLE IF NOT EXISTS totals ('
+        'id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL, size INTEGER NOT NULL)',
+        'INSERT OR IGNORE INTO totals SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses '
+        'WHERE NOT EXISTS (SELECT 1 FROM totals)',
+        'CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN '
+        'UPDATE totals SET entries = entries + 1, size = size + NEW.size; END',
+        'CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN '
+        'UPDATE totals SET entries = entries - 1, size = size - OLD.size; END',
+    )
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: int = 65536,
+        max_bytes: int = 256 * 1024 * 1024,
+        default_ttl: float = 60,
+        ttls: Optional[Dict[str, float]] = None,
+        timeout: float = 30,
+        access_flush_interval: float = 5
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.timeout = timeout
+        self.access_flush_interval = access_flush_interval
+        self.stats = CacheStats()
+
+        # Hits are recorded here and written out together, either along with the next write
+        # or once `access_flush_interval` has passed, so that reads don't take the write lock.
+        self.accesses: Dict[str, float] = {}
+        self.flushed_at = time.monotonic()
+
+        # sqlite3 connections are bound to the thread that created them, so every
+        # call goes through the same single worker thread, off the event loop. close() shuts
+        # it down and the next call starts a new one, since a cache can be shared by several
+        # clients and outlive the first of them to close.
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.connection: Optional[sqlite3.Connection] = None
+        self.running = 0
+
+    def __repr__(self) -> str:
+        return f'<SQLiteCache path={self.path!r} stats={self.stats!r}>'
+
+    def get_ttl(self, name: str) -> float:
+        return self.ttls.get(name, self.default_ttl)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='miku-sqlite-cache')
+
+        loop = asyncio.get_running_loop()
+
+        self.running += 1
+        try:
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+        finally:
+            self.running -= 1
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.connection is not None:
+            return self.connection
+
+        # isolation_level=None lets us issue BEGIN IMMEDIATE ourselves, which takes the
+        # write lock up front so concurrent writers from other processes wait on
+        # busy_timeout instead of failing halfway through a transaction.
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(f'PRAGMA busy_timeout={int(self.timeout * 1000)}')
+
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+        self.connection = connection
+        return connection
+
+    def _flush_accesses(self, connection: sqlite3.Connection) -> None:
+        # Expects to be called inside a transaction.
+        if self.accesses:
+            connection.executemany(
+                'UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE key = ?',
+                [(accessed_at, key) for key, accessed_at in self.accesses.items()]
+            )
+
+            self.accesses.clear()
+
+        self.flushed_at = time.monotonic()
+
+    def _write_accesses(self) -> None:
+        connection = self._connect()
+
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            self._flush_accesses(connection)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def _get(self, key: str) -> Optional[bytes]:
+        connection = self._connect()
+        now = time.time()
+
+        row = connection.execute('SELECT value, expires_at FROM responses WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+
+        # Expired rows are left for the next write to purge.
+        value, expires_at = row
+        if expires_at <= now:
+            return None
+
+        self.accesses[key] = now
+        if time.monotonic() - self.flushed_at >= self.access_flush_interval:
+            self._write_accesses()
+
+        return value
+
+    def _evict(self, connection: sqlite3.Connection, key: str) -> int:
+        evicted = 0
+        while True:
+            entries, size = connection.execute('SELECT entries, size FROM totals').fetchone()
+            if entries <= self.max_entries and size <= self.max_bytes:
+                return evicted
+
+            # The least recently used rows go in batches of a small fraction of the table,
+            # found through the accessed_at index, so that a full cache doesn't have to
+            # evict again on every single write.
+            limit = max(entries - self.max_entries, self.max_entries // 64, 1)
+            cursor = connection.execute(
+                'DELETE FROM responses WHERE key IN ('
+                'SELECT key FROM responses WHERE key != ? ORDER BY accessed_at LIMIT ?)',
+                (key, limit)
+            )
+
+            if cursor.rowcount <= 0:
+                return evicted
+
+            evicted += cursor.rowcount
+
+    def _set(self, key: str, value: bytes, ttl: float) -> int:
+        connection = self._connect()
+        now = time.time()
+
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            self._flush_accesses(connection)
+
+            # Deleted up front instead of using INSERT OR REPLACE, whose implicit delete
+            # doesn't fire the trigger that keeps the totals.
+            connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+            connection.execute(
+                'INSERT INTO responses (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                (key, value, len(value), now + ttl, now)
+            )
+
+            connection.execute('DELETE FROM responses WHERE expires_at <= ?', (now,))
+            evicted = self._evict(connection, key)
+
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+        return evicted
+
+    def _delete(self, key: str) -> None:
+        self._connect().execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def _clear(self) -> None:
+        self.accesses.clear()
+        self._connect().execute('DELETE FROM responses')
+
+    def _close(self) -> None:
+        if self.connection is not None:
+            if self.accesses:
+                self._write_accesses()
+
+            self.connection.close()
+            self.connection = None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self._run(self._get, key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        self.stats.evictions += await self._run(self._set, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete, key)
+
+    async def clear(self) -> None:
+        await self._run(self._clear)
+
+    async def close(self) -> None:
+        await self._run(self._close)
+
+        # Calls queued behind the close by other clients have reopened the connection on this
+        # worker thread, which then has to stay.
+        if self.running == 0 and self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
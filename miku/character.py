@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from .image import Image
 from .common import Name, FuzzyDate
+from .utils import IDComparable, cached_slot_property
 from . import types
 
 if TYPE_CHECKING:
@@ -14,10 +15,15 @@ __all__ = (
     'Character',
 )
 
-class Character:
+class Character(IDComparable):
     __slots__ = (
         '_payload',
         '_http',
+        '_cs_apperances',
+        '_cs_name',
+        '_cs_image',
+        '_cs_birth',
+        'id',
         'description',
         'favourites',
         'url',
@@ -29,31 +35,37 @@ class Character:
         self._payload = payload
         self._http = http
 
-        self.description: str = self._payload['description']
-        self.favourites: int = self._payload['favourites']
-        self.url: str = self._payload['siteUrl']
-        self.gender: str = self._payload['gender']
-        self.age: str = self._payload['age']
+        # Every key is optional since callers can choose which fields get requested.
+        self.id: int = self._payload.get('id')
+        self.description: str = self._payload.get('description')
+        self.favourites: int = self._payload.get('favourites')
+        self.url: str = self._payload.get('siteUrl')
+        self.gender: str = self._payload.get('gender')
+        self.age: str = self._payload.get('age')
 
     def __repr__(self) -> str:
-        return f'<Character name={self.name.full!r}>'
+        name = self.name
+        return f'<Character id={self.id} name={name.full if name else None!r}>'
 
-    @property
+    @cached_slot_property('_cs_apperances')
     def apperances(self) -> List[Media]:
         from .media import Media
 
-        animes = self._payload['media']['nodes']
-        return [Media(anime, self._http) for anime in animes]
+        animes = self._payload.get('media', {}).get('nodes', [])
+        return [self._http.hydrate(Media, anime) for anime in animes]
 
-    @property
-    def name(self) -> Name:
-        return Name(self._payload['name'])
+    @cached_slot_property('_cs_name')
+    def name(self) -> Optional[Name]:
+        name = self._payload.get('name')
+        return Name(name) if name else None
 
-    @property
-    def image(self) -> Image:
-        return Image(self._http.session, self._payload['image'])
+    @cached_slot_property('_cs_image')
+    def image(self) -> Optional[Image]:
+        image = self._payload.get('image')
+        return Image(self._http.session, image) if image else None
 
-    @property
-    def birth(self) -> FuzzyDate:
-        return FuzzyDate(self._payload['dateOfBirth'])
+    @cached_slot_property('_cs_birth')
+    def birth(self) -> Optional[FuzzyDate]:
+        birth = self._payload.get('dateOfBirth')
+        return FuzzyDate(birth) if birth else None
 
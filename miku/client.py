@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, List, Literal, Optional, Union, overload
+from typing import Any, Iterable, List, Literal, Optional, Union, overload
+from enum import Enum
 import aiohttp
 import sys
 import asyncio
 
 from .http import HTTPHandler
+from .cache import AbstractCache
+from .retry import RetryPolicy
+from .codec import JSONCodec
+from .identity import IdentityMap
+from .store import EntityStore
 from .media import Anime, Media, Manga, MediaTag
 from .paginator import Paginator
 from .character import Character
@@ -14,10 +20,30 @@ from .studio import Studio
 from .staff import Staff
 from .statistics import SiteStatistics
 from .threads import Thread
-from .enums import MediaType
+from .enums import CharacterSort, MediaFormat, MediaSeason, MediaSort, MediaStatus, MediaType, UserSort
+from .fields import FieldSelection
 
 PY310 = sys.version_info >= (3, 10)
 
+def _string_values(values: Optional[Union[str, Iterable[str]]]) -> Optional[List[str]]:
+    if values is None:
+        return None
+
+    # A single name, rather than being split up into its characters.
+    if isinstance(values, str):
+        values = (values,)
+
+    return list(values)
+
+def _enum_values(values: Optional[Union[Enum, Iterable[Enum]]]) -> Optional[List[str]]:
+    if values is None:
+        return None
+
+    if isinstance(values, Enum):
+        values = (values,)
+
+    return [value.value for value in values]
+
 def _get_event_loop(loop: Optional[asyncio.AbstractEventLoop] = None) -> asyncio.AbstractEventLoop:
     if loop:
         if not isinstance(loop, asyncio.BaseEventLoop):
@@ -43,10 +69,34 @@ class AnilistClient:
         access_token: Optional[str] = None,
         *,
         loop: Optional[asyncio.AbstractEventLoop] = None, 
-        session: Optional[aiohttp.ClientSession] = None
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrency: int = 10,
+        requests_per_minute: int = 90,
+        batch_window: Optional[float] = None,
+        max_batch_size: int = 10,
+        cache: Optional[AbstractCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        codec: Optional[JSONCodec] = None,
+        identity_map: Optional[IdentityMap] = None,
+        entity_store: Optional[EntityStore] = None,
+        retain_payload: bool = True
     ) -> None:
         self.loop = _get_event_loop(loop)
-        self.http = HTTPHandler(self.loop, access_token, session)
+        self.http = HTTPHandler(
+            self.loop, 
+            access_token, 
+            session,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            batch_window=batch_window,
+            max_batch_size=max_batch_size,
+            cache=cache,
+            retry_policy=retry_policy,
+            codec=codec,
+            identity_map=identity_map,
+            entity_store=entity_store,
+            retain_payload=retain_payload
+        )
 
     @classmethod
     async def from_authorization_pin(cls, pin: str, client_id: str, client_secret: str, **kwargs: Any) -> AnilistClient:
@@ -73,48 +123,80 @@ class AnilistClient:
         data = await self.http.get_site_statisics()
         return SiteStatistics(data)
 
-    async def fetch_user(self, search: Union[int, str]) -> User:
-        data = await self.http.get_user(search)
-        return User(data, self.http)
+    async def fetch_user(self, search: Union[int, str], *, fields: FieldSelection = 'full') -> User:
+        data = await self.http.get_user(search, fields)
+        return self.http.hydrate(User, data)
 
-    async def fetch_current_user(self) -> User:
-        data = await self.http.get_current_user()
-        return User(data, self.http)
+    async def fetch_current_user(self, *, fields: FieldSelection = 'full') -> User:
+        data = await self.http.get_current_user(fields)
+        return self.http.hydrate(User, data)
 
     @overload
-    async def fetch_media(self, search: Union[int, str], *, type: Literal[MediaType.ANIME]) -> Anime:
+    async def fetch_media(
+        self, search: Union[int, str], *, type: Literal[MediaType.ANIME], fields: FieldSelection = 'full'
+    ) -> Anime:
         ...
     @overload
-    async def fetch_media(self, search: Union[int, str], *, type: Literal[MediaType.MANGA]) -> Manga:
+    async def fetch_media(
+        self, search: Union[int, str], *, type: Literal[MediaType.MANGA], fields: FieldSelection = 'full'
+    ) -> Manga:
         ...
     @overload
-    async def fetch_media(self, search: Union[int, str], *, type: Literal[None] = None) -> Media:
+    async def fetch_media(
+        self, search: Union[int, str], *, type: Literal[None] = None, fields: FieldSelection = 'full'
+    ) -> Media:
         ...
-    async def fetch_media(self, search: Union[int, str], *, type: Optional[MediaType] = None) -> Media:
-        data = await self.http.get_media(search, type.value if type else None)
-        return Media(data, self.http)
+    async def fetch_media(
+        self, search: Union[int, str], *, type: Optional[MediaType] = None, fields: FieldSelection = 'full'
+    ) -> Media:
+        data = await self.http.get_media(search, type.value if type else None, fields)
+        return self.http.hydrate(Media, data)
 
-    async def fetch_anime(self, search: Union[int, str]) -> Anime:
-        return await self.fetch_media(search, type=MediaType.ANIME)
+    async def fetch_anime(self, search: Union[int, str], *, fields: FieldSelection = 'full') -> Anime:
+        return await self.fetch_media(search, type=MediaType.ANIME, fields=fields)
 
-    async def fetch_manga(self, search: Union[int, str]) -> Manga:
-        return await self.fetch_media(search, type=MediaType.MANGA)
+    async def fetch_manga(self, search: Union[int, str], *, fields: FieldSelection = 'full') -> Manga:
+        return await self.fetch_media(search, type=MediaType.MANGA, fields=fields)
         
-    async def fetch_character(self, search: Union[int, str]) -> Character:
-        data = await self.http.get_character(search)
-        return Character(data, self.http)
+    async def fetch_character(self, search: Union[int, str], *, fields: FieldSelection = 'full') -> Character:
+        data = await self.http.get_character(search, fields)
+        return self.http.hydrate(Character, data)
 
-    async def fetch_studio(self, search: Union[int, str]) -> Studio:
-        data = await self.http.get_studio(search)
-        return Studio(data, self.http)
+    async def fetch_studio(self, search: Union[int, str], *, fields: FieldSelection = 'full') -> Studio:
+        data = await self.http.get_studio(search, fields)
+        return self.http.hydrate(Studio, data)
 
-    async def fetch_staff(self, search: Union[int, str]) -> Staff:
-        data = await self.http.get_staff(search)
-        return Staff(data, self.http)
+    async def fetch_staff(self, search: Union[int, str], *, fields: FieldSelection = 'full') -> Staff:
+        data = await self.http.get_staff(search, fields)
+        return self.http.hydrate(Staff, data)
+
+    async def fetch_media_many(
+        self, ids: Iterable[int], *, fields: FieldSelection = 'full', concurrency: Optional[int] = None
+    ) -> List[Optional[Media]]:
+        data = await self.http.get_many('media', 'Media', ids, fields, concurrency=concurrency)
+        return [self.http.hydrate(Media, item) if item is not None else None for item in data]
+
+    async def fetch_characters_many(
+        self, ids: Iterable[int], *, fields: FieldSelection = 'full', concurrency: Optional[int] = None
+    ) -> List[Optional[Character]]:
+        data = await self.http.get_many('characters', 'Character', ids, fields, concurrency=concurrency)
+        return [self.http.hydrate(Character, item) if item is not None else None for item in data]
+
+    async def fetch_staff_many(
+        self, ids: Iterable[int], *, fields: FieldSelection = 'full', concurrency: Optional[int] = None
+    ) -> List[Optional[Staff]]:
+        data = await self.http.get_many('staff', 'Staff', ids, fields, concurrency=concurrency)
+        return [self.http.hydrate(Staff, item) if item is not None else None for item in data]
+
+    async def fetch_users_many(
+        self, ids: Iterable[int], *, fields: FieldSelection = 'full', concurrency: Optional[int] = None
+    ) -> List[Optional[User]]:
+        data = await self.http.get_users_many(ids, fields, concurrency=concurrency)
+        return [self.http.hydrate(User, item) if item is not None else None for item in data]
 
     async def fetch_thread(self, search: Union[int, str]):
         data = await self.http.get_thread(search)
-        return Thread(data, self.http)
+        return self.http.hydrate(Thread, data)
 
     async def fetch_all_tags(self) -> List[MediaTag]:
         data = await self.http.get_all_tags()
@@ -123,21 +205,132 @@ class AnilistClient:
     async def fetch_all_genres(self) -> List[str]:
         return await self.http.get_all_genres()
 
-    def users(self, name: str, *, per_page: int= 5, page: int = 0) -> Paginator[User]:
-        return self.http.get_users(name, per_page=per_page, page=page)
+    def users(
+        self,
+        name: Optional[str],
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        sort: Optional[Union[UserSort, Iterable[UserSort]]] = None
+    ) -> Paginator[User]:
+        return self.http.get_users(
+            name, per_page=per_page, page=page, fields=fields, prefetch=prefetch, sort=_enum_values(sort)
+        )
 
     @overload
-    def medias(self, name: str, type: Literal[MediaType.ANIME], *, per_page: int = 5, page: int = 0) -> Paginator[Anime]:
+    def medias(
+        self,
+        name: Optional[str],
+        type: Literal[MediaType.ANIME],
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        genres: Optional[Union[str, Iterable[str]]] = None,
+        tags: Optional[Union[str, Iterable[str]]] = None,
+        formats: Optional[Iterable[MediaFormat]] = None,
+        status: Optional[MediaStatus] = None,
+        season: Optional[MediaSeason] = None,
+        season_year: Optional[int] = None,
+        average_score_greater: Optional[int] = None,
+        popularity_greater: Optional[int] = None,
+        sort: Optional[Union[MediaSort, Iterable[MediaSort]]] = None
+    ) -> Paginator[Anime]:
         ...
     @overload
-    def medias(self, name: str, type: Literal[MediaType.MANGA], *, per_page: int = 5, page: int = 0) -> Paginator[Manga]:
+    def medias(
+        self,
+        name: Optional[str],
+        type: Literal[MediaType.MANGA],
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        genres: Optional[Union[str, Iterable[str]]] = None,
+        tags: Optional[Union[str, Iterable[str]]] = None,
+        formats: Optional[Iterable[MediaFormat]] = None,
+        status: Optional[MediaStatus] = None,
+        season: Optional[MediaSeason] = None,
+        season_year: Optional[int] = None,
+        average_score_greater: Optional[int] = None,
+        popularity_greater: Optional[int] = None,
+        sort: Optional[Union[MediaSort, Iterable[MediaSort]]] = None
+    ) -> Paginator[Manga]:
         ...
     @overload
-    def medias(self, name: str, type: Literal[None] = None, *, per_page: int = 5, page: int = 0) -> Paginator[Media]:
+    def medias(
+        self,
+        name: Optional[str],
+        type: Literal[None] = None,
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        genres: Optional[Union[str, Iterable[str]]] = None,
+        tags: Optional[Union[str, Iterable[str]]] = None,
+        formats: Optional[Iterable[MediaFormat]] = None,
+        status: Optional[MediaStatus] = None,
+        season: Optional[MediaSeason] = None,
+        season_year: Optional[int] = None,
+        average_score_greater: Optional[int] = None,
+        popularity_greater: Optional[int] = None,
+        sort: Optional[Union[MediaSort, Iterable[MediaSort]]] = None
+    ) -> Paginator[Media]:
         ...
-    def medias(self, name: str, type: Optional[MediaType] = None, *, per_page: int = 5, page: int = 0) -> Paginator[Media]: # type: ignore
-        return self.http.get_medias(name, type.value if type else None, per_page=per_page, page=page)
-
-    def characters(self, name: str, *, per_page: int = 5, page: int = 0) -> Paginator[Character]:
-        return self.http.get_characters(name, per_page=per_page, page=page)
+    def medias( # type: ignore
+        self,
+        name: Optional[str],
+        type: Optional[MediaType] = None,
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        genres: Optional[Union[str, Iterable[str]]] = None,
+        tags: Optional[Union[str, Iterable[str]]] = None,
+        formats: Optional[Iterable[MediaFormat]] = None,
+        status: Optional[MediaStatus] = None,
+        season: Optional[MediaSeason] = None,
+        season_year: Optional[int] = None,
+        average_score_greater: Optional[int] = None,
+        popularity_greater: Optional[int] = None,
+        sort: Optional[Union[MediaSort, Iterable[MediaSort]]] = None
+    ) -> Paginator[Media]:
+        # Filtering and ordering is left to AniList, so that only the matching media are
+        # ever transferred instead of being filtered out of the results afterwards.
+        return self.http.get_medias(
+            name,
+            type.value if type else None,
+            per_page=per_page,
+            page=page,
+            fields=fields,
+            prefetch=prefetch,
+            genre_in=_string_values(genres),
+            tag_in=_string_values(tags),
+            format_in=_enum_values(formats),
+            status=status.value if status else None,
+            season=season.value if season else None,
+            seasonYear=season_year,
+            averageScore_greater=average_score_greater,
+            popularity_greater=popularity_greater,
+            sort=_enum_values(sort)
+        )
 
+    def characters(
+        self,
+        name: Optional[str],
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        sort: Optional[Union[CharacterSort, Iterable[CharacterSort]]] = None
+    ) -> Paginator[Character]:
+        return self.http.get_characters(
+            name, per_page=per_page, page=page, fields=fields, prefetch=prefetch, sort=_enum_values(sort)
+        )
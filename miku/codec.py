@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Any
+from abc import ABC, abstractmethod
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+__all__ = (
+    'JSONCodec',
+    'StdlibJSONCodec',
+    'OrjsonCodec',
+    'UjsonCodec',
+    'get_default_codec',
+)
+
+class JSONCodec(ABC):
+    name: str
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} name={self.name!r}>'
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+class StdlibJSONCodec(JSONCodec):
+    name = 'json'
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+class OrjsonCodec(JSONCodec):
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError('orjson is not installed')
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+class UjsonCodec(JSONCodec):
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        if ujson is None:
+            raise RuntimeError('ujson is not installed')
+
+    def encode(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return ujson.loads(data)
+
+def get_default_codec() -> JSONCodec:
+    if orjson is not None:
+        return OrjsonCodec()
+
+    if ujson is not None:
+        return UjsonCodec()
+
+    return StdlibJSONCodec()
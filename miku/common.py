@@ -18,18 +18,18 @@ class Name:
     )
 
     def __init__(self, payload: types.Name) -> None:
-        self.first: str = payload['first']
-        self.middle: str = payload['middle']
-        self.last: str = payload['last']
-        self.full: str = payload['full']
-        self.native: str = payload['native']
-        self.alternatives: List[str] = payload['alternatives']
+        self.first: str = payload.get('first')
+        self.middle: str = payload.get('middle')
+        self.last: str = payload.get('last')
+        self.full: str = payload.get('full')
+        self.native: str = payload.get('native')
+        self.alternatives: List[str] = payload.get('alternative') or []
 
 class FuzzyDate:
     __slots__ = ('year', 'month', 'day')
 
     def __init__(self, payload: types.FuzzyDate) -> None:
-        self.year: Optional[int] = payload['year']
-        self.month: Optional[int] = payload['month']
-        self.day: Optional[int] = payload['day']
+        self.year: Optional[int] = payload.get('year')
+        self.month: Optional[int] = payload.get('month')
+        self.day: Optional[int] = payload.get('day')
 
@@ -1,16 +1,21 @@
-from typing import Any, Dict, List, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+import re
 
 __all__ = (
     'HTTPException',
     'Forbidden',
     'BadRequest',
     'NotFound',
+    'TooManyRequests',
     'AniListServerError',
 )
 
+_COMPLEXITY_ERROR = re.compile(r'complexity should be (\d+) but got (\d+)', re.IGNORECASE)
+
 class HTTPException(Exception):
     def __init__(self, status: int, data: Union[str, Dict[str, Any]]) -> None:
         self.status = status
+        self.data = data
         errors: List[Dict[str, Any]] = []
 
         if isinstance(data, dict):
@@ -43,6 +48,9 @@ class Forbidden(HTTPException):
 class NotFound(HTTPException):
     pass
 
+class TooManyRequests(HTTPException):
+    pass
+
 class AniListServerError(HTTPException):
     pass
 
@@ -51,6 +59,20 @@ ERROR_MAPPING: Dict[int, Type[HTTPException]] = {
     401: Unauthorized,
     403: Forbidden,
     404: NotFound,
+    429: TooManyRequests,
     500: AniListServerError
 }
 
+def get_complexity_overrun(error: HTTPException) -> Optional[Tuple[int, int]]:
+    # The limit and the actual cost AniList reports when it rejects a document for being too
+    # complex, e.g. "Max query complexity should be 500 but got 1250."
+    if error.status != 400 or not isinstance(error.data, dict):
+        return None
+
+    for item in error.data.get('errors') or []:
+        match = _COMPLEXITY_ERROR.search(str(item.get('message', '')))
+        if match is not None:
+            return int(match.group(1)), int(match.group(2))
+
+    return None
+
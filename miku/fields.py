@@ -1,6 +1,10 @@
-from typing import Tuple, Any
+from typing import Any, Dict, Literal, Tuple, Union
 
 __all__ = (
+    'FieldSelection',
+    'FIELD_PRESETS',
+    'FRAGMENTS',
+    'resolve_fields',
     'USER_FIELDS',
     'USER_FAVOURITES_FIELDS',
     'STUDIO_FIELDS',
@@ -14,9 +18,18 @@ __all__ = (
     'THREAD_COMMENT_FIELDS',
     'MEDIA_LIST_FIELDS',
     'MEDIA_LIST_GROUP_FIELDS',
-    'MEDIA_LIST_COLLECTION_FIELDS'
+    'MEDIA_LIST_COLLECTION_FIELDS',
+    'USER_MINIMAL_FIELDS',
+    'STUDIO_MINIMAL_FIELDS',
+    'CHARACTER_MINIMAL_FIELDS',
+    'MEDIA_MINIMAL_FIELDS',
+    'STAFF_MINIMAL_FIELDS',
 )
 
+# Either the name of one of the presets in FIELD_PRESETS or a custom selection
+# written the same way as the tuples below.
+FieldSelection = Union[Literal['minimal', 'full'], Tuple[Any, ...]]
+
 MEDIA_LIST_TYPE_OPTION_FIELDS = (
     'sectionOrder',
     'splitCompletedSectionByFormat',
@@ -26,6 +39,7 @@ MEDIA_LIST_TYPE_OPTION_FIELDS = (
 )
 
 USER_FIELDS: Tuple[Any, ...] = (
+    '__typename',
     'id',
     'name',
     'about',
@@ -45,6 +59,7 @@ USER_FIELDS: Tuple[Any, ...] = (
 )
 
 STUDIO_FIELDS: Tuple[str, ...] = (
+    '__typename',
     'id',
     'name',
     'siteUrl',
@@ -53,6 +68,7 @@ STUDIO_FIELDS: Tuple[str, ...] = (
 )
 
 CHARACTER_FIELDS: Tuple[Any, ...] = (
+    '__typename',
     'id',
     'description',
     'gender',
@@ -69,6 +85,7 @@ MEDIA_TAG_FIELDS: Tuple[Any, ...] = (
 )
 
 MEDIA_FIELDS: Tuple[Any, ...] = (
+    '__typename',
     'description',
     'averageScore',
     'meanScore',
@@ -118,6 +135,7 @@ MEDIA_TREND_FIELDS = (
 
 
 STAFF_FIELDS: Tuple[Any, ...] = (
+    '__typename',
     'id',
     'languageV2',
     'description',
@@ -227,3 +245,93 @@ MEDIA_LIST_COLLECTION_FIELDS: Tuple[Any, ...] = (
     {'lists': MEDIA_LIST_GROUP_FIELDS},
 )
 
+
+USER_MINIMAL_FIELDS: Tuple[Any, ...] = (
+    '__typename',
+    'id',
+    'name',
+    'siteUrl',
+    {'avatar': ('large', 'medium')},
+)
+
+STUDIO_MINIMAL_FIELDS: Tuple[Any, ...] = (
+    '__typename',
+    'id',
+    'name',
+    'siteUrl',
+)
+
+CHARACTER_MINIMAL_FIELDS: Tuple[Any, ...] = (
+    '__typename',
+    'id',
+    'siteUrl',
+    {'name': ('first', 'middle', 'last', 'full', 'native', 'alternative')},
+    {'image': ('large', 'medium')},
+)
+
+MEDIA_MINIMAL_FIELDS: Tuple[Any, ...] = (
+    '__typename',
+    'id',
+    'idMal',
+    'type',
+    'format',
+    'status',
+    'siteUrl',
+    'averageScore',
+    'popularity',
+    {'title': ('romaji', 'english', 'native')},
+    {'coverImage': ('large', 'medium')},
+)
+
+STAFF_MINIMAL_FIELDS: Tuple[Any, ...] = (
+    '__typename',
+    'id',
+    'siteUrl',
+    {'name': ('first', 'middle', 'last', 'full', 'native', 'alternative')},
+    {'image': ('large', 'medium')},
+)
+
+FIELD_PRESETS: Dict[str, Dict[str, Tuple[Any, ...]]] = {
+    'Media': {
+        'minimal': MEDIA_MINIMAL_FIELDS,
+        'full': MEDIA_FIELDS,
+    },
+    'Character': {
+        'minimal': CHARACTER_MINIMAL_FIELDS,
+        'full': CHARACTER_FIELDS + ({'media': {'nodes': MEDIA_FIELDS}},),
+    },
+    'User': {
+        'minimal': USER_MINIMAL_FIELDS,
+        'full': USER_FIELDS + ({'favourites': USER_FAVOURITES_FIELDS},),
+    },
+    'Staff': {
+        'minimal': STAFF_MINIMAL_FIELDS,
+        'full': STAFF_FIELDS + ({'characters': {'nodes': CHARACTER_FIELDS}},),
+    },
+    'Studio': {
+        'minimal': STUDIO_MINIMAL_FIELDS,
+        'full': STUDIO_FIELDS,
+    },
+}
+
+# Selections that are sent as named fragments whenever a document would otherwise repeat
+# them, keyed on the fragment name.
+FRAGMENTS: Dict[str, Tuple[str, Tuple[Any, ...]]] = {
+    'UserParts': ('User', USER_FIELDS),
+    'StudioParts': ('Studio', STUDIO_FIELDS),
+    'CharacterParts': ('Character', CHARACTER_FIELDS),
+    'StaffParts': ('Staff', STAFF_FIELDS),
+    'MediaParts': ('Media', MEDIA_FIELDS),
+    'ThreadParts': ('Thread', THREAD_FIELDS),
+}
+
+def resolve_fields(type: str, fields: FieldSelection) -> Tuple[Any, ...]:
+    if not isinstance(fields, str):
+        # Lets the entity store recognise the result, the presets already select it.
+        return fields if '__typename' in fields else ('__typename', *fields)
+
+    presets = FIELD_PRESETS[type]
+    if fields not in presets:
+        raise ValueError(f'Unknown field preset {fields!r} for {type}, expected one of {", ".join(presets)}')
+
+    return presets[fields]
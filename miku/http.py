@@ -1,20 +1,199 @@
-from typing import Any, Dict, Optional, Union, Tuple, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Counter, Dict, Iterable, Optional, Set, Union, Tuple, Type, TypeVar, List
+import collections
+import functools
 import asyncio
 import aiohttp
+import json
+import weakref
 
-from .query import Query, QueryField, QueryFields, QueryOperation
+from .query import MAX_QUERY_COMPLEXITY, Query, QueryField, QueryFields, QueryFragment, QueryOperation
 from .fields import *
 from .media import Media
 from .character import Character
 from .paginator import Paginator, ChunkPaginator
 from .user import User, MediaListGroup
-from .errors import HTTPException, ERROR_MAPPING
+from .errors import HTTPException, ERROR_MAPPING, get_complexity_overrun
+from .ratelimit import RateLimiter
+from .batching import RequestBatcher
+from .cache import AbstractCache, make_cache_key
+from .retry import RetryPolicy
+from .codec import JSONCodec, get_default_codec
+from .identity import IdentityMap
+from .store import EntityStore
+from .streaming import JSONPath, JSONStreamScanner
+from .utils import release_payload
 from . import types
 
 __all__ = (
     'HTTPHandler',
 )
 
+T = TypeVar('T')
+
+LOOKUP_VARIABLE_TYPES: Dict[str, str] = {
+    'id': 'Int',
+    'search': 'String',
+    'userId': 'Int',
+    'mediaId': 'Int',
+    'type': 'MediaType',
+}
+
+# The arguments of each searchable `Page` connection that filter or order the results on the
+# server, every one of them passed through a variable of the same name.
+PAGE_FILTER_VARIABLE_TYPES: Dict[str, Dict[str, str]] = {
+    'media': {
+        'search': 'String',
+        'type': 'MediaType',
+        'genre_in': '[String]',
+        'tag_in': '[String]',
+        'format_in': '[MediaFormat]',
+        'status': 'MediaStatus',
+        'season': 'MediaSeason',
+        'seasonYear': 'Int',
+        'averageScore_greater': 'Int',
+        'popularity_greater': 'Int',
+        'sort': '[MediaSort]',
+    },
+    'users': {
+        'search': 'String',
+        'sort': '[UserSort]',
+    },
+    'characters': {
+        'search': 'String',
+        'sort': '[CharacterSort]',
+    },
+}
+
+# The largest `perPage` AniList accepts.
+MAX_PAGE_SIZE = 50
+
+def _check_filters(name: str, filters: Dict[str, Any]) -> None:
+    # Caught here rather than as a validation error from AniList for an undeclared variable.
+    unknown = [key for key in filters if key not in PAGE_FILTER_VARIABLE_TYPES[name]]
+    if unknown:
+        raise TypeError(f'Unknown {name} filters: {", ".join(unknown)}')
+
+def _fit_chunk_size(
+    size: int, document: Callable[[int], Tuple[Query, Dict[str, Any]]], ratio: float, limit: int
+) -> int:
+    # The estimate of a chunk grows by the same amount with every id, so two sizes are enough
+    # to tell how many ids fit under the limit once scaled by what AniList actually charges.
+    query, variables = document(1)
+    base = query.complexity(variables)
+
+    query, variables = document(2)
+    step = query.complexity(variables) - base
+
+    if step <= 0:
+        return size
+
+    return max(1, min(size, 1 + int((limit / ratio - base) // step)))
+
+async def _stream_values(
+    chunks: AsyncIterator[bytes], scanner: JSONStreamScanner
+) -> AsyncIterator[List[Tuple[JSONPath, Any]]]:
+    # Whatever the scanner picks out of each chunk, followed by what is left once the body ends.
+    async for data in chunks:
+        yield scanner.feed(data)
+
+    yield scanner.close()
+
+def _is_media_list_value(path: JSONPath) -> bool:
+    # Only `hasNextChunk` and the entries themselves, never a whole group at once.
+    if len(path) == 3:
+        return path[2] == 'hasNextChunk'
+
+    return len(path) == 6 and path[2] == 'lists' and path[4] == 'entries'
+
+# Keyed on identity rather than value, a custom selection that happens to look the same
+# as one of these (or two types sharing a shape) is still written out in full.
+_FRAGMENT_SELECTIONS: Dict[int, Tuple[str, str]] = {
+    id(selection): (name, type) for name, (type, selection) in FRAGMENTS.items()
+}
+
+def _count_fragment_selections(fields: Union[Dict[str, Any], Tuple[Any, ...]], counts: Counter[int]) -> None:
+    for field in (fields,) if isinstance(fields, dict) else fields:
+        if isinstance(field, _Conditional):
+            _count_fragment_selections(field.selection, counts)
+
+        if not isinstance(field, dict):
+            continue
+
+        for selection in field.values():
+            if id(selection) in _FRAGMENT_SELECTIONS:
+                counts[id(selection)] += 1
+
+            _count_fragment_selections(selection, counts)
+
+class _Conditional:
+    # Part of a selection that is only sent when `$full` is true (`include`), or only when
+    # it isn't (`skip`). Built as an inline fragment carrying the directive.
+    __slots__ = ('directive', 'selection')
+
+    def __init__(self, directive: str, selection: Tuple[Any, ...]) -> None:
+        self.directive = directive
+        self.selection = selection
+
+_MERGED_PRESETS: Dict[Tuple[int, int], Tuple[Any, ...]] = {}
+_MERGED_PRESET_IDS: Set[int] = set()
+
+def _merge_presets(minimal: Tuple[Any, ...], full: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    # Kept for the lifetime of the process so that the cached query builders always get
+    # the same object for the same pair of presets.
+    key = (id(minimal), id(full))
+
+    selection = _MERGED_PRESETS.get(key)
+    if selection is None:
+        selection = tuple(field for field in minimal if field in full)
+
+        only_full = tuple(field for field in full if field not in minimal)
+        if only_full:
+            selection += (_Conditional('include', only_full),)
+
+        only_minimal = tuple(field for field in minimal if field not in full)
+        if only_minimal:
+            selection += (_Conditional('skip', only_minimal),)
+
+        _MERGED_PRESETS[key] = selection
+        _MERGED_PRESET_IDS.add(id(selection))
+
+    return selection
+
+def _with_id(selection: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    # Results of a bulk fetch are matched back to the requested ids, so `id` is always selected.
+    return selection if 'id' in selection else ('id', *selection)
+
+def _freeze(value: Any) -> Any:
+    # Merged presets live as long as the process does, so their identity is enough and the
+    # whole selection doesn't have to be walked on every request.
+    if id(value) in _MERGED_PRESET_IDS:
+        return ('preset', id(value))
+
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+
+    if isinstance(value, (tuple, list)):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+def _cached_query(func: Callable[..., Query]) -> Callable[..., Query]:
+    # Query documents only depend on the shape of the arguments, never on their values,
+    # so each shape is built once per process and shared by every handler.
+    queries: Dict[Tuple[Any, ...], Query] = {}
+
+    @functools.wraps(func)
+    def wrapper(self: 'HTTPHandler', *args: Any) -> Query:
+        key = _freeze(args)
+
+        query = queries.get(key)
+        if query is None:
+            query = queries[key] = func(self, *args)
+            query.compile()
+
+        return query
+    return wrapper
+
 class HTTPHandler:
     URL = 'https://graphql.anilist.co'
 
@@ -22,12 +201,39 @@ class HTTPHandler:
         self, 
         loop: asyncio.AbstractEventLoop, 
         token: Optional[str] = None,
-        session: Optional[aiohttp.ClientSession] = None
+        session: Optional[aiohttp.ClientSession] = None,
+        *,
+        max_concurrency: int = 10,
+        requests_per_minute: int = 90,
+        batch_window: Optional[float] = None,
+        max_batch_size: int = 10,
+        cache: Optional[AbstractCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        codec: Optional[JSONCodec] = None,
+        identity_map: Optional[IdentityMap] = None,
+        entity_store: Optional[EntityStore] = None,
+        retain_payload: bool = True
     ) -> None:
         self.session: aiohttp.ClientSession = session # type: ignore
         self.loop = loop
         self.token = token
-        self.lock = asyncio.Lock()
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.codec = codec or get_default_codec()
+        self.identity_map = identity_map
+        self.entity_store = entity_store
+        self.retain_payload = retain_payload
+        self.ratelimiter = RateLimiter(max_concurrency=max_concurrency, per_minute=requests_per_minute)
+
+        self.inflight: Dict[str, asyncio.Task[Dict[str, Any]]] = {}
+
+        # What AniList charged for a document relative to Query.complexity(), learned from the
+        # documents it rejected so that later ones can be sized before they are sent.
+        self.complexity_ratios: weakref.WeakKeyDictionary[Query, float] = weakref.WeakKeyDictionary()
+
+        self.batcher: Optional[RequestBatcher] = None
+        if batch_window is not None:
+            self.batcher = RequestBatcher(self, window=batch_window, max_size=max_batch_size)
 
     async def create_session(self) -> aiohttp.ClientSession:
         self.session = session = aiohttp.ClientSession(loop=self.loop)
@@ -49,6 +255,63 @@ class HTTPHandler:
             return data['access_token']
 
     async def request(self, query: Query, rtype: Optional[str] = None, **variables: Any):
+        # Filters that aren't set are left out rather than sent as null.
+        variables = {key: value for key, value in variables.items() if value is not None}
+
+        if query.operation and query.operation.type == 'query':
+            data = await self.fetch(query, variables)
+        else:
+            data = await self.execute(query, variables)
+
+        if self.entity_store is not None:
+            self.entity_store.normalize(data)
+
+        return data if rtype is None else data[rtype]
+
+    async def fetch(self, query: Query, variables: Dict[str, Any]) -> Dict[str, Any]:
+        key = make_cache_key(query.compile(), json.dumps(variables, sort_keys=True), self.token)
+
+        ttl = 0.0
+        if self.cache is not None and query.fields is not None:
+            ttl = self.cache.get_ttl(query.fields.name)
+
+        if ttl > 0:
+            body = await self.cache.get(key) # type: ignore
+            if body is not None:
+                return self.codec.decode(body)
+
+        # Identical queries that are already in flight share one request instead of sending another.
+        task = self.inflight.get(key)
+        if task is None:
+            task = self.loop.create_task(self.store(key, ttl, query, variables))
+            self.inflight[key] = task
+
+            def forget(task: asyncio.Task[Dict[str, Any]]) -> None:
+                self.inflight.pop(key, None)
+                if not task.cancelled():
+                    task.exception()
+
+            task.add_done_callback(forget)
+
+        # Shielded so that one caller going away doesn't cancel the request for everyone else.
+        return await asyncio.shield(task)
+
+    async def store(self, key: str, ttl: float, query: Query, variables: Dict[str, Any]) -> Dict[str, Any]:
+        data = await self.execute(query, variables)
+        if ttl > 0:
+            await self.cache.set(key, self.codec.encode(data), ttl) # type: ignore
+
+        return data
+
+    async def execute(self, query: Query, variables: Dict[str, Any]) -> Dict[str, Any]:
+        if self.batcher is not None and self.batcher.is_batchable(query):
+            return await self.batcher.submit(query, variables)
+
+        return await self.send(query, variables)
+
+    async def prepare(
+        self, query: Query, variables: Dict[str, Any]
+    ) -> Tuple[aiohttp.ClientSession, Dict[str, str], bytes]:
         headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         if self.token:
             headers['Authorization'] = 'Bearer ' + self.token
@@ -57,53 +320,222 @@ class HTTPHandler:
         if not session:
             session = await self.create_session()
 
-        payload: Dict[str, Any] = {'query': query.build()}
+        payload: Dict[str, Any] = {'query': query.compile()}
         if variables:
             payload['variables'] = variables
 
-        async with self.lock:
-            async with session.post(self.URL, json=payload, headers=headers) as response:
-                data = await response.json()
-                if response.status == 200:
-                    return data['data'] if rtype is None else data['data'][rtype]
-
-                if response.status == 429:
-                    retry_after = float(response.headers['Retry-After'])
-                    await asyncio.sleep(retry_after)
-
-                    return await self.request(query, rtype, **variables)
+        return session, headers, self.codec.encode(payload)
+
+    def get_error(self, response: aiohttp.ClientResponse, content: bytes) -> Tuple[HTTPException, Optional[float]]:
+        try:
+            data = self.codec.decode(content)
+        except ValueError:
+            # Proxies in front of AniList answer some 5xx errors with an HTML page.
+            data = content.decode(errors='replace')
+
+        retry_after: Optional[float] = None
+        if 'Retry-After' in response.headers:
+            retry_after = float(response.headers['Retry-After'])
+
+        if response.status == 429:
+            # Pause every request sharing this limiter, not just this one.
+            self.ratelimiter.block(retry_after or 60)
+
+        error = ERROR_MAPPING.get(response.status, HTTPException)
+        return error(response.status, data), retry_after
+
+    async def send(self, query: Query, variables: Dict[str, Any]) -> Dict[str, Any]:
+        session, headers, body = await self.prepare(query, variables)
+
+        policy = self.retry_policy
+        policy.budget.deposit()
+
+        idempotent = query.operation is not None and query.operation.type == 'query'
+        attempt = 0
+        throttles = 0
+
+        while True:
+            retry_after: Optional[float] = None
+
+            try:
+                async with self.ratelimiter.acquire():
+                    async with session.post(self.URL, data=body, headers=headers) as response:
+                        self.ratelimiter.update(response.headers)
+
+                        content = await response.read()
+                        if response.status == 200:
+                            try:
+                                return self.codec.decode(content)['data']
+                            except ValueError:
+                                raise HTTPException(response.status, content.decode(errors='replace'))
+
+                        error, retry_after = self.get_error(response, content)
+                        raise error
+            except (HTTPException, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                throttled = isinstance(exc, HTTPException) and exc.status == 429
+                if throttled:
+                    throttles += 1
+                else:
+                    attempt += 1
+
+                if not policy.should_retry(exc, attempt, idempotent, throttles):
+                    raise
+
+                # The limiter already holds back throttled requests until the block expires.
+                if throttled:
+                    continue
+
+            await asyncio.sleep(policy.get_delay(attempt, retry_after))
+
+    async def stream(
+        self,
+        query: Query,
+        variables: Dict[str, Any],
+        predicate: Callable[[JSONPath], bool],
+        *,
+        chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[Tuple[JSONPath, Any]]:
+        # Like `send`, but hands out the values matching `predicate` while the body is still
+        # being received instead of buffering all of it. Skips the cache, batching and dedup.
+        session, headers, body = await self.prepare(query, variables)
+
+        policy = self.retry_policy
+        policy.budget.deposit()
+
+        idempotent = query.operation is not None and query.operation.type == 'query'
+        attempt = 0
+        throttles = 0
+        streamed = False
+
+        def wanted(path: JSONPath) -> bool:
+            return path == ('errors',) or predicate(path)
+
+        while True:
+            retry_after: Optional[float] = None
+
+            try:
+                # The limiter slot only covers sending the request and receiving the headers.
+                # Holding it while the body is streamed would leave every other request
+                # waiting on however long the consumer takes with each entry.
+                async with self.ratelimiter.acquire():
+                    response = await session.post(self.URL, data=body, headers=headers)
+
+                async with response:
+                    self.ratelimiter.update(response.headers)
+
+                    if response.status != 200:
+                        error, retry_after = self.get_error(response, await response.read())
+                        raise error
+
+                    scanner = JSONStreamScanner(wanted, self.codec.decode)
+
+                    chunks = response.content.iter_chunked(chunk_size)
+                    async for values in _stream_values(chunks, scanner):
+                        for path, value in values:
+                            if path == ('errors',):
+                                raise HTTPException(response.status, {'errors': value})
+
+                            if self.entity_store is not None:
+                                self.entity_store.normalize(value)
+
+                            streamed = True
+                            yield path, value
+
+                    return
+            except (HTTPException, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                throttled = isinstance(exc, HTTPException) and exc.status == 429
+                if throttled:
+                    throttles += 1
+                else:
+                    attempt += 1
+
+                # Whatever was already handed out can't be taken back, so only retry up to then.
+                if streamed or not policy.should_retry(exc, attempt, idempotent, throttles):
+                    raise
+
+                if throttled:
+                    continue
+
+            await asyncio.sleep(policy.get_delay(attempt, retry_after))
 
-                error = ERROR_MAPPING.get(response.status, HTTPException)
-                raise error(response.status, data)
+    async def close(self):
+        if self.batcher is not None:
+            await self.batcher.drain()
 
-        raise RuntimeError('Unreachable code')
+        if self.cache is not None:
+            await self.cache.close()
 
-    async def close(self):
         if not self.session:
             return None
 
         return await self.session.close()
 
-    def parse_args(self, search: Union[int, str]):
-        operation_variables: Dict[str, Any] = {}
-        variables: Dict[str, Any] = {}
-        arguments: Dict[str, Any] = {}
-
-        if isinstance(search, str):
-            operation_variables['$search'] = 'String'
-            arguments['search'] = '$search'
-            variables['search'] = search
+    def hydrate(self, cls: Type[T], payload: Dict[str, Any]) -> T:
+        if self.identity_map is None:
+            obj = cls(payload, self) # type: ignore
         else:
-            operation_variables['$id'] = 'Int'
-            arguments['id'] = '$id'
-            variables['id'] = search
+            obj = self.identity_map.hydrate(cls, payload, self)
+
+        if not self.retain_payload:
+            release_payload(obj)
+
+        return obj
+
+    def lookup(
+        self, typename: str, kind: str, variables: Dict[str, Any], fields: FieldSelection
+    ) -> Optional[Dict[str, Any]]:
+        if self.entity_store is None or kind != 'id':
+            return None
+
+        return self.entity_store.resolve(typename, variables['id'], resolve_fields(typename, fields))
 
-        return operation_variables, variables, arguments
+    def lookup_many(self, typename: str, ids: List[int], fields: FieldSelection) -> Dict[int, Dict[str, Any]]:
+        if self.entity_store is None:
+            return {}
 
-    def build_query(self, fields: Union[Dict[str, Any], Tuple[Any, ...]], obj: Union[QueryFields, QueryField]) -> None:
+        selection = resolve_fields(typename, fields)
+        found = {id: self.entity_store.resolve(typename, id, selection) for id in ids}
+
+        return {id: data for id, data in found.items() if data is not None}
+
+    def parse_args(self, search: Union[int, str]) -> Tuple[str, Dict[str, Any]]:
+        kind = 'search' if isinstance(search, str) else 'id'
+        return kind, {kind: search}
+
+    def build_query(
+        self,
+        fields: Union[Dict[str, Any], Tuple[Any, ...]],
+        obj: Union[QueryFields, QueryField, QueryFragment],
+        query: Optional[Query] = None
+    ) -> None:
+        shared: Set[int] = set()
+        if query is not None:
+            # Only selections that would otherwise be written out more than once are worth a
+            # fragment. Everything nested in a shared selection is then shared as well, so a
+            # fragment always has the same definition in every document that uses it.
+            counts: Counter[int] = collections.Counter()
+            _count_fragment_selections(fields, counts)
+
+            shared = {key for key, count in counts.items() if count > 1}
+
+        self._build_selection(fields, obj, query, shared)
+
+    def _build_selection(
+        self,
+        fields: Union[Dict[str, Any], Tuple[Any, ...]],
+        obj: Union[QueryFields, QueryField, QueryFragment],
+        query: Optional[Query],
+        shared: Set[int]
+    ) -> None:
         def _build_dict(f: Dict[str, Any]) -> None:
             name = next(iter(f))
-            return self.build_query(f[name], obj.add_field(name))
+            field = obj.add_field(name)
+
+            selection = f[name]
+            if query is not None and id(selection) in shared:
+                return self._build_fragment(selection, field, query, shared)
+
+            return self._build_selection(selection, field, query, shared)
 
         if isinstance(fields, dict):
             return _build_dict(fields)
@@ -111,210 +543,208 @@ class HTTPHandler:
         for field in fields:
             if isinstance(field, dict):
                 _build_dict(field)
+            elif isinstance(field, _Conditional):
+                if query is not None and query.operation is not None:
+                    query.operation.variables['$full'] = 'Boolean!'
+
+                inline = obj.add_field('...').add_directive(field.directive, **{'if': '$full'})
+                self._build_selection(field.selection, inline, query, shared)
             else:
                 obj.add_field(field)
 
-    async def get_all_tags(self) -> List[types.MediaTag]:
-        operation = QueryOperation(type='query')
-
-        fields = QueryFields('MediaTagCollection')
-        self.build_query(MEDIA_TAG_FIELDS, fields)
-
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'MediaTagCollection')
+    def _build_fragment(
+        self, selection: Tuple[Any, ...], obj: Union[QueryField, QueryFragment], query: Query, shared: Set[int]
+    ) -> None:
+        name, type = _FRAGMENT_SELECTIONS[id(selection)]
 
-    async def get_all_genres(self) -> List[str]:
-        operation = QueryOperation(type='query')
-        fields = QueryFields('GenreCollection')
+        fragment = query.fragments.get(name)
+        if fragment is None:
+            fragment = query.add_fragment(QueryFragment(name, type))
+            self._build_selection(selection, fragment, query, shared)
 
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'GenreCollection')
+        obj.add_spread(fragment)
 
-    async def get_thread_from_user_id(self, user_id: int) -> types.Thread:
-        operation = QueryOperation(type='query', variables={'$userId': 'Int'})
+    def build_page_query(self, name: str, variables: Dict[str, str], **arguments: Any) -> Tuple[Query, QueryField]:
+        operation = QueryOperation(type='query', variables={'$page': 'Int', '$perPage': 'Int', **variables})
 
-        fields = QueryFields('Thread', userId='$userId')
-        self.build_query(THREAD_FIELDS, fields)
+        fields = QueryFields('Page', page='$page', perPage='$perPage')
+        fields.add_field('pageInfo', 'total', 'currentPage', 'lastPage', 'hasNextPage', 'perPage')
 
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'Thread', userId=user_id)
+        field = fields.add_field(name, **arguments)
+        return Query(operation=operation, fields=fields), field
 
-    async def get_thread(self, search: Union[str, int]) -> types.Thread:
-        operation_variables, variables, arguments = self.parse_args(search)
-        operation = QueryOperation(type='query', variables=operation_variables)
-        
-        fields = QueryFields('Thread', **arguments)
-        self.build_query(THREAD_FIELDS, fields)
-        
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'Thread', **variables)
+    def build_search_query(self, name: str) -> Tuple[Query, QueryField]:
+        # Same as lookups, the filters that aren't used are left out of the variables so that
+        # every combination of them shares one document.
+        filters = PAGE_FILTER_VARIABLE_TYPES[name]
+        variables = {f'${argument}': type for argument, type in filters.items()}
 
-    async def get_thread_comments(self, id: int) -> List[types.ThreadComment]:
-        operation_variables, variables, arguments = self.parse_args(id)
-        operation = QueryOperation(type='query', variables=operation_variables)
+        return self.build_page_query(name, variables, **{argument: f'${argument}' for argument in filters})
 
-        fields = QueryFields('ThreadComment', **arguments)
-        self.build_query(THREAD_COMMENT_FIELDS, fields)
+    def build_lookup_query(self, name: str, *arguments: str) -> Tuple[Query, QueryFields]:
+        # Every way of looking the object up shares one document, the ones that aren't used
+        # are simply left out of the variables.
+        operation = QueryOperation(
+            type='query', variables={f'${argument}': LOOKUP_VARIABLE_TYPES[argument] for argument in arguments}
+        )
 
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'ThreadComment', **variables)
+        fields = QueryFields(name, **{argument: f'${argument}' for argument in arguments})
+        return Query(operation=operation, fields=fields), fields
 
-    async def get_user(self, search: Union[str, int]) -> types.User:
-        operation_variables, variables, arguments = self.parse_args(search)
-        operation = QueryOperation(type='query', variables=operation_variables)
+    def select(
+        self, type: str, fields: FieldSelection, full: Optional[Tuple[Any, ...]] = None
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        # Returns the selection to build a document from and the variables it needs. Both
+        # presets of a type share a document, which one is sent is picked with `$full`.
+        selection = resolve_fields(type, fields)
+        if not isinstance(fields, str):
+            return selection, {}
 
-        fields = QueryFields('User', **arguments)
-        self.build_query(USER_FIELDS, fields)
+        presets = FIELD_PRESETS[type]
+        return _merge_presets(presets['minimal'], full or presets['full']), {'full': fields == 'full'}
 
-        favourites = fields.add_field('favourites')
-        self.build_query(USER_FAVOURITES_FIELDS, favourites)
+    @_cached_query
+    def media_tag_collection_query(self) -> Query:
+        operation = QueryOperation(type='query')
 
+        fields = QueryFields('MediaTagCollection')
         query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'User', **variables)
 
-    async def get_current_user(self) -> types.User:
-        operation = QueryOperation(type='query')
+        self.build_query(MEDIA_TAG_FIELDS, fields, query)
+        return query
 
-        fields = QueryFields('Viewer')
-        self.build_query(USER_FIELDS, fields)
+    @_cached_query
+    def genre_collection_query(self) -> Query:
+        operation = QueryOperation(type='query')
+        fields = QueryFields('GenreCollection')
 
-        favourites = fields.add_field('favourites')
-        self.build_query(USER_FAVOURITES_FIELDS, favourites)
+        return Query(operation=operation, fields=fields)
 
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'Viewer')
+    @_cached_query
+    def thread_query(self) -> Query:
+        query, fields = self.build_lookup_query('Thread', 'id', 'userId', 'search')
+        self.build_query(THREAD_FIELDS, fields, query)
 
-    async def get_media(self, search: Union[str, int], type: Optional[str] = None) -> types.Media:
-        operation_variables, variables, arguments = self.parse_args(search)
-        operation = QueryOperation(type='query', variables=operation_variables)
+        return query
 
-        fields = QueryFields('Media', **arguments)
-        if type is not None:
-            fields.arguments['type'] = type
+    @_cached_query
+    def thread_comment_query(self) -> Query:
+        query, fields = self.build_lookup_query('ThreadComment', 'id')
+        self.build_query(THREAD_COMMENT_FIELDS, fields, query)
 
-        self.build_query(MEDIA_FIELDS, fields)
-        query = Query(operation=operation, fields=fields)
+        return query
 
-        return await self.request(query, 'Media', **variables)
+    @_cached_query
+    def user_query(self, selection: Tuple[Any, ...]) -> Query:
+        query, fields = self.build_lookup_query('User', 'id', 'search')
+        self.build_query(selection, fields, query)
 
-    async def get_media_trend(self, media_id: int) -> types.MediaTrend:
-        operation = QueryOperation(type='query', variables={'$mediaId': 'Int'})
+        return query
 
-        fields = QueryFields('MediaTrend', mediaId='$mediaId')
-        self.build_query(MEDIA_TREND_FIELDS, fields)
+    @_cached_query
+    def viewer_query(self, selection: Tuple[Any, ...]) -> Query:
+        operation = QueryOperation(type='query')
 
+        fields = QueryFields('Viewer')
         query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'MediaTrend', mediaId=media_id)
 
-    async def get_studio(self, search: Union[str, int]) -> types.Studio:
-        operation_variables, variables, arguments = self.parse_args(search)
-        operation = QueryOperation(type='query', variables=operation_variables)
+        self.build_query(selection, fields, query)
+        return query
 
-        fields = QueryFields('Studio', **arguments)
-        self.build_query(STUDIO_FIELDS, fields)
+    @_cached_query
+    def media_query(self, selection: Tuple[Any, ...]) -> Query:
+        query, fields = self.build_lookup_query('Media', 'id', 'search', 'type')
+        self.build_query(selection, fields, query)
 
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'Studio', **variables)
+        return query
 
-    async def get_staff(self, search: Union[str, int]) -> types.Staff:
-        operation_variables, variables, arguments = self.parse_args(search)
-        operation = QueryOperation(
-            type='query', 
-            variables=operation_variables
-        )
+    @_cached_query
+    def media_trend_query(self) -> Query:
+        query, fields = self.build_lookup_query('MediaTrend', 'mediaId')
+        self.build_query(MEDIA_TREND_FIELDS, fields, query)
 
-        fields = QueryFields('Staff', **arguments)
-        self.build_query(STAFF_FIELDS, fields)
+        return query
 
-        characters = fields.add_field('characters')
-        nodes = characters.add_field('nodes')
-        self.build_query(CHARACTER_FIELDS, nodes)
+    @_cached_query
+    def studio_query(self, selection: Tuple[Any, ...]) -> Query:
+        query, fields = self.build_lookup_query('Studio', 'id', 'search')
+        self.build_query(selection, fields, query)
 
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'Staff', **variables)
+        return query
 
-    async def get_site_statisics(self) -> types.SiteStatistics:
+    @_cached_query
+    def staff_query(self, selection: Tuple[Any, ...]) -> Query:
+        query, fields = self.build_lookup_query('Staff', 'id', 'search')
+        self.build_query(selection, fields, query)
+
+        return query
+
+    @_cached_query
+    def site_statistics_query(self) -> Query:
         operation = QueryOperation(type='query')
 
         fields = QueryFields('SiteStatistics')
-        self.build_query(SITE_STATISTICS_FIELDS, fields)
-
         query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'SiteStatistics')
 
-    async def get_character(self, search: Union[str, int]) -> types.Character:
-        operation_variables, variables, arguments = self.parse_args(search)
-        operation = QueryOperation(type='query', variables=operation_variables)
+        self.build_query(SITE_STATISTICS_FIELDS, fields, query)
+        return query
 
-        fields = QueryFields('Character', **arguments)
-        self.build_query(CHARACTER_FIELDS, fields)
+    @_cached_query
+    def character_query(self, selection: Tuple[Any, ...]) -> Query:
+        query, fields = self.build_lookup_query('Character', 'id', 'search')
+        self.build_query(selection, fields, query)
 
-        media = fields.add_field('media')
-        nodes = media.add_field('nodes')
-        self.build_query(MEDIA_FIELDS, nodes)
+        return query
 
-        query = Query(operation=operation, fields=fields)
-        return await self.request(query, 'Character', **variables)
+    @_cached_query
+    def users_query(self, selection: Tuple[Any, ...]) -> Query:
+        query, field = self.build_search_query('users')
+        self.build_query(selection, field, query)
 
-    def get_users(self, search: str, *, per_page: int = 5, page: int = 0):
-        operation = QueryOperation(
-            type='query', 
-            variables={'$page': 'Int', '$perPage': 'Int', '$search': 'String'}
-        )
+        return query
 
-        fields = QueryFields('Page', page='$page', perPage='$perPage')
-        fields.add_field('pageInfo', 'total', 'currentPage', 'lastPage', 'hasNextPage', 'perPage')
+    @_cached_query
+    def medias_query(self, selection: Tuple[Any, ...]) -> Query:
+        query, field = self.build_search_query('media')
+        self.build_query(selection, field, query)
 
-        field = fields.add_field('users', search='$search')
-        self.build_query(USER_FIELDS, field)
+        return query
 
-        query = Query(operation=operation, fields=fields)
-        return Paginator(self, User, 'users', query, search=search, page=page, perPage=per_page)
+    @_cached_query
+    def characters_query(self, selection: Tuple[Any, ...]) -> Query:
+        query, field = self.build_search_query('characters')
+        self.build_query(selection, field, query)
 
-    def get_medias(self, search: str, type: Optional[str] = None, *, per_page: int = 5, page: int = 0):
-        operation = QueryOperation(
-            type='query', 
-            variables={'$page': 'Int', '$perPage': 'Int', '$search': 'String'}
-        )
+        return query
 
-        fields = QueryFields('Page', page='$page', perPage='$perPage')
-        fields.add_field('pageInfo', 'total', 'currentPage', 'lastPage', 'hasNextPage', 'perPage')
+    @_cached_query
+    def bulk_query(self, name: str, selection: Tuple[Any, ...]) -> Query:
+        query, field = self.build_page_query(name, {'$ids': '[Int]'}, id_in='$ids')
+        self.build_query(_with_id(selection), field, query)
 
-        field = fields.add_field('media', search='$search')
-        self.build_query(MEDIA_FIELDS, field)
+        return query
 
-        if type:
-            field.arguments['type'] = type
+    @_cached_query
+    def bulk_users_query(self, count: int, selection: Tuple[Any, ...]) -> Query:
+        # Page.users can't be filtered by id, so every user gets its own aliased root instead.
+        operation = QueryOperation(type='query', variables={f'$id{index}': 'Int' for index in range(count)})
+        query = Query(operation=operation)
 
-        characters = field.add_field('characters')
-        nodes = characters.add_field('nodes')
-        self.build_query(CHARACTER_FIELDS, nodes)
+        # The same selection is repeated for every root, so it's only written out once.
+        fragment = QueryFragment('BulkUserParts', 'User')
+        self.build_query(_with_id(selection), fragment, query)
 
-        query = Query(operation=operation, fields=fields)
-        return Paginator(self, Media, 'media', query, search=search, page=page, perPage=per_page)
+        query.add_fragment(fragment)
+        for index in range(count):
+            root = QueryFields('User', alias=f'u{index}', id=f'$id{index}')
+            root.add_spread(fragment)
 
-    def get_characters(self, search: str, *, per_page: int = 5, page: int = 0):
-        operation = QueryOperation(
-            type='query', 
-            variables={'$page': 'Int', '$perPage': 'Int', '$search': 'String'}
-        )
+            query.add_root(root)
 
-        fields = QueryFields('Page', page='$page', perPage='$perPage')
-        fields.add_field('pageInfo', 'total', 'currentPage', 'lastPage', 'hasNextPage', 'perPage')
-
-        field = fields.add_field('characters', search='$search')
-        self.build_query(CHARACTER_FIELDS, field)
-
-        media = field.add_field('media')
-        nodes = media.add_field('nodes')
-        self.build_query(MEDIA_FIELDS, nodes)
+        return query
 
-        query = Query(operation=operation, fields=fields)
-        return Paginator(self, Character, 'characters', query, search=search, page=page, perPage=per_page)
-
-    def get_media_list_collection(
-        self, user_id: int, type: str, per_chunk: int = 50, chunk: int = 0
-    ) -> ChunkPaginator[MediaListGroup]:
+    @_cached_query
+    def media_list_collection_query(self) -> Query:
         operation = QueryOperation(
             type='query', 
             variables={'$userId': 'Int', '$type': 'MediaType', '$chunk': 'Int', '$perChunk': 'Int'}
@@ -328,9 +758,325 @@ class HTTPHandler:
             perChunk='$perChunk'
         )
 
-        self.build_query(MEDIA_LIST_COLLECTION_FIELDS, fields)
         query = Query(operation=operation, fields=fields)
 
+        self.build_query(MEDIA_LIST_COLLECTION_FIELDS, fields, query)
+        return query
+
+    async def get_all_tags(self) -> List[types.MediaTag]:
+        query = self.media_tag_collection_query()
+        return await self.request(query, 'MediaTagCollection')
+
+    async def get_all_genres(self) -> List[str]:
+        query = self.genre_collection_query()
+        return await self.request(query, 'GenreCollection')
+
+    async def get_thread_from_user_id(self, user_id: int) -> types.Thread:
+        query = self.thread_query()
+        return await self.request(query, 'Thread', userId=user_id)
+
+    async def get_thread(self, search: Union[str, int]) -> types.Thread:
+        _, variables = self.parse_args(search)
+
+        query = self.thread_query()
+        return await self.request(query, 'Thread', **variables)
+
+    async def get_thread_comments(self, id: int) -> List[types.ThreadComment]:
+        query = self.thread_comment_query()
+        return await self.request(query, 'ThreadComment', id=id)
+
+    async def get_user(self, search: Union[str, int], fields: FieldSelection = 'full') -> types.User:
+        kind, variables = self.parse_args(search)
+
+        data = self.lookup('User', kind, variables, fields)
+        if data is not None:
+            return data # type: ignore
+
+        selection, extra = self.select('User', fields)
+
+        query = self.user_query(selection)
+        return await self.request(query, 'User', **variables, **extra)
+
+    async def get_current_user(self, fields: FieldSelection = 'full') -> types.User:
+        selection, extra = self.select('User', fields)
+
+        query = self.viewer_query(selection)
+        return await self.request(query, 'Viewer', **extra)
+
+    async def get_media(
+        self, search: Union[str, int], type: Optional[str] = None, fields: FieldSelection = 'full'
+    ) -> types.Media:
+        kind, variables = self.parse_args(search)
+
+        data = self.lookup('Media', kind, variables, fields)
+        if data is not None and (type is None or data.get('type') == type):
+            return data # type: ignore
+
+        selection, extra = self.select('Media', fields)
+
+        query = self.media_query(selection)
+        return await self.request(query, 'Media', **variables, type=type, **extra)
+
+    async def get_media_trend(self, media_id: int) -> types.MediaTrend:
+        query = self.media_trend_query()
+        return await self.request(query, 'MediaTrend', mediaId=media_id)
+
+    async def get_studio(self, search: Union[str, int], fields: FieldSelection = 'full') -> types.Studio:
+        kind, variables = self.parse_args(search)
+
+        data = self.lookup('Studio', kind, variables, fields)
+        if data is not None:
+            return data # type: ignore
+
+        selection, extra = self.select('Studio', fields)
+
+        query = self.studio_query(selection)
+        return await self.request(query, 'Studio', **variables, **extra)
+
+    async def get_staff(self, search: Union[str, int], fields: FieldSelection = 'full') -> types.Staff:
+        kind, variables = self.parse_args(search)
+
+        data = self.lookup('Staff', kind, variables, fields)
+        if data is not None:
+            return data # type: ignore
+
+        selection, extra = self.select('Staff', fields)
+
+        query = self.staff_query(selection)
+        return await self.request(query, 'Staff', **variables, **extra)
+
+    async def get_site_statisics(self) -> types.SiteStatistics:
+        query = self.site_statistics_query()
+        return await self.request(query, 'SiteStatistics')
+
+    async def get_character(self, search: Union[str, int], fields: FieldSelection = 'full') -> types.Character:
+        kind, variables = self.parse_args(search)
+
+        data = self.lookup('Character', kind, variables, fields)
+        if data is not None:
+            return data # type: ignore
+
+        selection, extra = self.select('Character', fields)
+
+        query = self.character_query(selection)
+        return await self.request(query, 'Character', **variables, **extra)
+
+    async def fetch_chunks(
+        self,
+        ids: List[int],
+        size: int,
+        document: Callable[[int], Tuple[Query, Dict[str, Any]]],
+        fetch: Callable[[List[int]], Awaitable[List[Dict[str, Any]]]],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        # `document` gives the query and variables sent for a chunk of a given size. Its
+        # estimate overshoots AniList's scoring too much to size chunks by on its own, so until
+        # AniList rejects the document, chunks are as large as allowed and the first one goes
+        # out on its own so that a whole wave of concurrent chunks isn't rejected at once. A
+        # rejection reports what the document actually cost, and the ratio to the estimate is
+        # kept to size the chunks of this call and every later one before they are sent.
+        key, _ = document(size)
+
+        ratio = self.complexity_ratios.get(key)
+        if ratio is not None:
+            size = _fit_chunk_size(size, document, ratio, MAX_QUERY_COMPLEXITY)
+
+        pending = collections.deque(ids)
+        items: List[Dict[str, Any]] = []
+
+        async def fetch_next() -> None:
+            nonlocal size
+
+            chunk = [pending.popleft() for _ in range(min(size, len(pending)))]
+            try:
+                items.extend(await fetch(chunk))
+            except HTTPException as exc:
+                overrun = get_complexity_overrun(exc)
+                if overrun is None or len(chunk) == 1:
+                    raise
+
+                limit, cost = overrun
+                query, variables = document(len(chunk))
+
+                ratio = self.complexity_ratios[key] = cost / query.complexity(variables)
+                size = min(size, _fit_chunk_size(len(chunk) - 1, document, ratio, limit))
+
+                pending.extendleft(reversed(chunk))
+
+        async def worker() -> None:
+            while pending:
+                await fetch_next()
+
+        if pending and ratio is None:
+            await fetch_next()
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency or self.ratelimiter.max_concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # The call fails as a whole, so the chunks still queued would only spend requests.
+            for task in workers:
+                task.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+
+        return items
+
+    async def get_many(
+        self,
+        name: str,
+        type: str,
+        ids: Iterable[int],
+        fields: FieldSelection = 'full',
+        *,
+        concurrency: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        ids = list(ids)
+
+        selection, extra = self.select(type, fields)
+        query = self.bulk_query(name, selection)
+
+        async def fetch_chunk(chunk: List[int]) -> List[Dict[str, Any]]:
+            data = await self.request(query, 'Page', ids=chunk, page=1, perPage=len(chunk), **extra)
+            return data[name]
+
+        unique = list(dict.fromkeys(ids))
+        found = self.lookup_many(type, unique, fields)
+
+        items = await self.fetch_chunks(
+            [id for id in unique if id not in found],
+            MAX_PAGE_SIZE,
+            lambda size: (query, {'perPage': size, **extra}),
+            fetch_chunk,
+            concurrency
+        )
+
+        found.update((item['id'], item) for item in items)
+        return [found.get(id) for id in ids]
+
+    async def get_users_many(
+        self,
+        ids: Iterable[int],
+        fields: FieldSelection = 'full',
+        *,
+        chunk_size: int = 25,
+        concurrency: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        ids = list(ids)
+        selection, extra = self.select('User', fields)
+
+        async def fetch_chunk(chunk: List[int]) -> List[Dict[str, Any]]:
+            query = self.bulk_users_query(len(chunk), selection)
+            variables = {f'id{index}': id for index, id in enumerate(chunk)}
+
+            try:
+                data = await self.request(query, **variables, **extra)
+            except HTTPException as exc:
+                # An unknown id fails the whole document, but the other roots still resolve.
+                data = exc.data.get('data') if isinstance(exc.data, dict) else None
+                if data is None:
+                    raise
+
+                if self.entity_store is not None:
+                    self.entity_store.normalize(data)
+
+            return [user for user in data.values() if user is not None]
+
+        unique = list(dict.fromkeys(ids))
+        found = self.lookup_many('User', unique, fields)
+
+        items = await self.fetch_chunks(
+            [id for id in unique if id not in found],
+            min(chunk_size, MAX_PAGE_SIZE),
+            lambda size: (self.bulk_users_query(size, selection), extra),
+            fetch_chunk,
+            concurrency
+        )
+
+        found.update((item['id'], item) for item in items)
+        return [found.get(id) for id in ids]
+
+    def get_users(
+        self,
+        search: Optional[str],
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        **filters: Any
+    ):
+        _check_filters('users', filters)
+
+        # Favourites are only requested when fetching a single user, not for every search result.
+        selection, extra = self.select('User', fields, full=USER_FIELDS)
+
+        query = self.users_query(selection)
+        return Paginator(
+            self, User, 'users', query, prefetch=prefetch, search=search, page=page, perPage=per_page, **filters, **extra
+        )
+
+    def get_medias(
+        self,
+        search: Optional[str],
+        type: Optional[str] = None,
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        **filters: Any
+    ):
+        _check_filters('media', filters)
+        selection, extra = self.select('Media', fields)
+
+        query = self.medias_query(selection)
+        return Paginator(
+            self,
+            Media,
+            'media',
+            query,
+            prefetch=prefetch,
+            search=search,
+            type=type,
+            page=page,
+            perPage=per_page,
+            **filters,
+            **extra
+        )
+
+    def get_characters(
+        self,
+        search: Optional[str],
+        *,
+        per_page: int = 5,
+        page: int = 0,
+        fields: FieldSelection = 'full',
+        prefetch: int = 0,
+        **filters: Any
+    ):
+        _check_filters('characters', filters)
+        selection, extra = self.select('Character', fields)
+
+        query = self.characters_query(selection)
+        return Paginator(
+            self,
+            Character,
+            'characters',
+            query,
+            prefetch=prefetch,
+            search=search,
+            page=page,
+            perPage=per_page,
+            **filters,
+            **extra
+        )
+
+    def stream_media_list_collection(
+        self, user_id: int, type: str, per_chunk: int = 500, chunk: int = 0
+    ) -> AsyncIterator[Tuple[JSONPath, Any]]:
+        query = self.media_list_collection_query()
         variables = {
             'userId': user_id,
             'type': type,
@@ -338,5 +1084,17 @@ class HTTPHandler:
             'perChunk': per_chunk
         }
 
-        return ChunkPaginator(self, MediaListGroup, 'MediaListCollection', query, **variables)
+        return self.stream(query, variables, _is_media_list_value)
+
+    def get_media_list_collection(
+        self, user_id: int, type: str, per_chunk: int = 50, chunk: int = 0, prefetch: int = 0
+    ) -> ChunkPaginator[MediaListGroup]:
+        query = self.media_list_collection_query()
+        variables = {
+            'userId': user_id,
+            'type': type,
+            'chunk': chunk,
+            'perChunk': per_chunk
+        }
 
+        return ChunkPaginator(self, MediaListGroup, 'MediaListCollection', query, prefetch=prefetch, **variables)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, TypeVar
+import weakref
+
+if TYPE_CHECKING:
+    from .http import HTTPHandler
+
+__all__ = (
+    'IdentityMap',
+)
+
+T = TypeVar('T')
+
+def _cached_slots(cls: type) -> Tuple[str, ...]:
+    return tuple(
+        name for klass in cls.__mro__ for name in getattr(klass, '__slots__', ()) if name.startswith('_cs_')
+    )
+
+class IdentityMap:
+    def __init__(self) -> None:
+        # Entries go away on their own once nothing else references the object.
+        self.objects: weakref.WeakValueDictionary[Tuple[type, Any], Any] = weakref.WeakValueDictionary()
+
+    def __repr__(self) -> str:
+        return f'<IdentityMap entries={len(self.objects)}>'
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def get(self, cls: Type[T], id: Any) -> Optional[T]:
+        return self.objects.get((cls, id))
+
+    def hydrate(self, cls: Type[T], payload: Dict[str, Any], http: HTTPHandler) -> T:
+        id = payload.get('id')
+        if id is None:
+            return cls(payload, http) # type: ignore
+
+        key = (cls, id)
+
+        obj = self.objects.get(key)
+        if obj is None:
+            obj = self.objects[key] = cls(payload, http) # type: ignore
+            return obj
+
+        if obj._payload is not payload:
+            # Fields from the newer payload win and anything it didn't select is kept, then
+            # whatever was derived from the old payload gets recomputed on next access.
+            obj.__init__({**obj._payload, **payload}, http)
+            for name in _cached_slots(cls):
+                try:
+                    delattr(obj, name)
+                except AttributeError:
+                    pass
+
+        return obj
+
+    def clear(self) -> None:
+        self.objects.clear()
@@ -15,7 +15,7 @@ class Image:
     def __init__(self, session: ClientSession, payload: types.Image) -> None:
         self._session = session 
     
-        self.large = payload['large']
+        self.large = payload.get('large')
         self.medium = payload.get('medium')
 
     @classmethod
@@ -28,6 +28,7 @@ __all__ = (
 class MediaTrend:
     __slots__ = (
         '_payload',
+        '_cs_date',
         'media_id',
         'episode',
         'releasing',
@@ -49,7 +50,7 @@ class MediaTrend:
     def __repr__(self) -> str:
         return f'<MediaTrend media_id={self.media_id} episode={self.episode} average_score={self.average_score}>'
 
-    @property
+    @cached_slot_property('_cs_date')
     def date(self) -> datetime.datetime:
         return datetime.datetime.utcfromtimestamp(self._payload['date'])
 
@@ -57,9 +58,9 @@ class MediaTitle:
     __slots__ = ('romaji', 'english', 'native')
 
     def __init__(self, payload: types.MediaTitle) -> None:
-        self.romaji: str = payload['romaji']
-        self.english: Optional[str] = payload['english']
-        self.native: str = payload['native']
+        self.romaji: str = payload.get('romaji')
+        self.english: Optional[str] = payload.get('english')
+        self.native: str = payload.get('native')
 
     def __repr__(self) -> str:
         return '<Title romaji={0.romaji!r} english={0.english!r} native={0.native!r}>'.format(self)
@@ -103,7 +104,7 @@ class MediaTag(IDComparable):
         return f'<MediaTag id={self.id} name={self.name!r}>'
 
 class MediaAiringSchedule(IDComparable):
-    __slots__ = ('_payload', 'id', 'episode', 'media_id')
+    __slots__ = ('_payload', '_cs_airing_at', '_cs_time_until_airing', 'id', 'episode', 'media_id')
 
     def __init__(self, payload: types.MediaAiringSchedule) -> None:
         self._payload = payload
@@ -112,11 +113,11 @@ class MediaAiringSchedule(IDComparable):
         self.episode: int = payload['episode']
         self.media_id: int = payload['mediaId']
 
-    @property
+    @cached_slot_property('_cs_airing_at')
     def airing_at(self) -> datetime.datetime:
         return datetime.datetime.utcfromtimestamp(self._payload['airingAt'])
 
-    @property
+    @cached_slot_property('_cs_time_until_airing')
     def time_until_airing(self) -> datetime.timedelta:
         return datetime.timedelta(seconds=self._payload['timeUntilAiring'])
 
@@ -136,7 +137,7 @@ class MediaStreamingEpisode:
         return f'<MediaStreamingEpisode title={self.title!r} site={self.site!r}>'
 
 class MediaRank(IDComparable):
-    __slots__ = ('_payload', 'id', 'rank', 'year', 'all_time', 'context')
+    __slots__ = ('_payload', '_cs_type', '_cs_format', '_cs_season', 'id', 'rank', 'year', 'all_time', 'context')
 
     def __init__(self, payload: types.MediaRank) -> None:
         self._payload = payload
@@ -150,15 +151,15 @@ class MediaRank(IDComparable):
     def __repr__(self) -> str:
         return f'<MediaRank id={self.id} rank={self.rank}>'
 
-    @property
+    @cached_slot_property('_cs_type')
     def type(self) -> MediaRankType:
         return MediaRankType(self._payload['type'])
 
-    @property
+    @cached_slot_property('_cs_format')
     def format(self) -> MediaFormat:
         return MediaFormat(self._payload['format'])
 
-    @property
+    @cached_slot_property('_cs_season')
     def season(self) -> MediaSeason:
         return MediaSeason(self._payload['season'])
     
@@ -168,6 +169,20 @@ class Media(IDComparable):
         '_payload',
         '_http',
         '_cs_characters',
+        '_cs_type',
+        '_cs_format',
+        '_cs_status',
+        '_cs_season',
+        '_cs_source',
+        '_cs_updated_at',
+        '_cs_title',
+        '_cs_tags',
+        '_cs_trailer',
+        '_cs_next_airing_episode',
+        '_cs_streaming_episodes',
+        '_cs_rankings',
+        '_cs_banner',
+        '_cs_cover',
         'id',
         'mal_id',
         'url',
@@ -182,119 +197,124 @@ class Media(IDComparable):
         'hashtag',
         'popularity',
         'favourites',
+        'duration',
+        'chapters',
+        'volumes',
+        'episodes',
     )
 
     def __init__(self, payload: types.Media, http: HTTPHandler) -> None:
         self._payload = payload
         self._http = http
 
-        self.id: int = payload['id']
-        self.mal_id: int = payload['idMal']
-        self.url: str = self._payload['siteUrl']
-        self.average_score: Optional[int] = self._payload['averageScore']
-        self.mean_score: int = self._payload['meanScore']
-        self.is_licensed: bool = self._payload['isLicensed']
-        self.genres: List[str] = self._payload['genres']
-        self.trending: int = self._payload['trending']
-        self.is_adult: bool = self._payload['isAdult']
-        self.synonyms: List[str] = self._payload['synonyms']
-        self.description: str = self._payload['description']
-        self.hashtag: str = self._payload['hashtag']
-        self.popularity: int = self._payload['popularity']
-        self.favourites: int = self._payload['favourites']
+        # Every key is optional since callers can choose which fields get requested.
+        self.id: int = payload.get('id')
+        self.mal_id: int = payload.get('idMal')
+        self.url: str = payload.get('siteUrl')
+        self.average_score: Optional[int] = payload.get('averageScore')
+        self.mean_score: int = payload.get('meanScore')
+        self.is_licensed: bool = payload.get('isLicensed')
+        self.genres: List[str] = payload.get('genres', [])
+        self.trending: int = payload.get('trending')
+        self.is_adult: bool = payload.get('isAdult')
+        self.synonyms: List[str] = payload.get('synonyms', [])
+        self.description: str = payload.get('description')
+        self.hashtag: str = payload.get('hashtag')
+        self.popularity: int = payload.get('popularity')
+        self.favourites: int = payload.get('favourites')
+        self.duration: Optional[int] = payload.get('duration')
+        self.chapters: Optional[int] = payload.get('chapters')
+        self.volumes: Optional[int] = payload.get('volumes')
+        self.episodes: Optional[int] = payload.get('episodes')
 
     def __repr__(self) -> str:
         name = self.__class__.__name__
-        return f'<{name} id={self.id} title={self.title.romaji!r} average_score={self.average_score}>'
-
-    @property
-    def type(self) -> MediaType:
-        return MediaType(self._payload['type'])
-
-    @property
-    def format(self) -> MediaFormat:
-        return MediaFormat(self._payload['format'])
-
-    @property
-    def status(self) -> MediaStatus:
-        return MediaStatus(self._payload['status'])
-
-    @property
-    def season(self) -> MediaSeason:
-        return MediaSeason(self._payload['season'])
-
-    @property
-    def source(self) -> MediaSource:
-        return MediaSource(self._payload['source'])
-
-    @property
-    def duration(self) -> Optional[int]:
-        return self._payload['duration']
-
-    @property
-    def chapters(self) -> Optional[int]:
-        return self._payload['chapters']
-
-    @property
-    def volumes(self) -> Optional[int]:
-        return self._payload['volumes']
-
-    @property
-    def episodes(self) -> Optional[int]:
-        return self._payload['episodes']
-
-    @property
-    def updated_at(self) -> datetime.datetime:
-        return datetime.datetime.utcfromtimestamp(self._payload['updatedAt'])
-
-    @property
-    def title(self) -> MediaTitle:
-        return MediaTitle(self._payload['title'])
-
-    @property
+        title = self.title
+
+        return f'<{name} id={self.id} title={title.romaji if title else None!r} average_score={self.average_score}>'
+
+    @cached_slot_property('_cs_type')
+    def type(self) -> Optional[MediaType]:
+        type = self._payload.get('type')
+        return MediaType(type) if type else None
+
+    @cached_slot_property('_cs_format')
+    def format(self) -> Optional[MediaFormat]:
+        format = self._payload.get('format')
+        return MediaFormat(format) if format else None
+
+    @cached_slot_property('_cs_status')
+    def status(self) -> Optional[MediaStatus]:
+        status = self._payload.get('status')
+        return MediaStatus(status) if status else None
+
+    @cached_slot_property('_cs_season')
+    def season(self) -> Optional[MediaSeason]:
+        season = self._payload.get('season')
+        return MediaSeason(season) if season else None
+
+    @cached_slot_property('_cs_source')
+    def source(self) -> Optional[MediaSource]:
+        source = self._payload.get('source')
+        return MediaSource(source) if source else None
+
+    @cached_slot_property('_cs_updated_at')
+    def updated_at(self) -> Optional[datetime.datetime]:
+        updated_at = self._payload.get('updatedAt')
+        return datetime.datetime.utcfromtimestamp(updated_at) if updated_at is not None else None
+
+    @cached_slot_property('_cs_title')
+    def title(self) -> Optional[MediaTitle]:
+        title = self._payload.get('title')
+        return MediaTitle(title) if title else None
+
+    @cached_slot_property('_cs_tags')
     def tags(self) -> List[MediaTag]:
-        return [MediaTag(tag) for tag in self._payload['tags']]
+        return [MediaTag(tag) for tag in self._payload.get('tags') or []]
 
-    @property
+    @cached_slot_property('_cs_trailer')
     def trailer(self) -> Optional[MediaTrailer]:
-        return MediaTrailer(self._payload['trailer']) if self._payload['trailer'] else None
+        trailer = self._payload.get('trailer')
+        return MediaTrailer(trailer) if trailer else None
 
-    @property
+    @cached_slot_property('_cs_next_airing_episode')
     def next_airing_episode(self) -> Optional[MediaAiringSchedule]:
-        data = self._payload['nextAiringEpisode']
+        data = self._payload.get('nextAiringEpisode')
         return MediaAiringSchedule(data) if data else None
 
-    @property
+    @cached_slot_property('_cs_streaming_episodes')
     def streaming_episodes(self) -> Optional[List[MediaStreamingEpisode]]:
-        data = self._payload['streamingEpisodes']
+        data = self._payload.get('streamingEpisodes')
         return [MediaStreamingEpisode(episode) for episode in data] if data else None
 
-    @property
+    @cached_slot_property('_cs_rankings')
     def rankings(self) -> List[MediaRank]:
-        return [MediaRank(rank) for rank in self._payload['rankings']]
+        return [MediaRank(rank) for rank in self._payload.get('rankings') or []]
 
-    @property
-    def banner(self) -> Image:
-        return Image.from_url(self._http.session, self._payload['bannerImage'])
+    @cached_slot_property('_cs_banner')
+    def banner(self) -> Optional[Image]:
+        banner = self._payload.get('bannerImage')
+        return Image.from_url(self._http.session, banner) if banner else None
 
-    @property
-    def cover(self) -> Image:
-        return Image(self._http.session, self._payload['coverImage'])
+    @cached_slot_property('_cs_cover')
+    def cover(self) -> Optional[Image]:
+        cover = self._payload.get('coverImage')
+        return Image(self._http.session, cover) if cover else None
 
     @cached_slot_property('_cs_characters')
     def characters(self) -> List[Character]:
         from .character import Character
 
-        characters = self._payload['characters']['nodes']
-        return [Character(data, self._http) for data in characters]
+        characters = self._payload.get('characters', {}).get('nodes', [])
+        return [self._http.hydrate(Character, data) for data in characters]
 
     async def fetch_trend(self) -> MediaTrend:
         data = await self._http.get_media_trend(self.id)
         return MediaTrend(data)
 
 class Anime(Media):
-    pass
+    __slots__ = ()
 
 class Manga(Media):
-    pass
+    __slots__ = ()
 
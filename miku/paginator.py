@@ -2,23 +2,30 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterable,
     AsyncIterator,
+    Deque,
     Dict, 
     Callable, 
+    Coroutine,
     Generic, 
     Generator,
+    Iterable,
     List,
     Literal, 
     Optional, 
     TYPE_CHECKING, 
+    Tuple,
     Type, 
     TypeVar,
     overload, 
 )
 from abc import ABC, abstractmethod
+import collections
+import asyncio
 
 from .query import Query
-from .utils import MaybeAwaitable, maybe_coroutine
+from .utils import MaybeAwaitable, maybe_coroutine, gather_with_concurrency
 
 if TYPE_CHECKING:
     from .http import HTTPHandler
@@ -33,43 +40,208 @@ __all__ = (
     'ChunkPaginator'
 )
 
-class _MappedPaginator(Generic[T, S]):
-    def __init__(self, paginator: AbstractAsyncPaginator[T], f: Callable[[T], MaybeAwaitable[S]]) -> None:
-        self._paginator = paginator
-        self._func = f
-
-    def __await__(self) -> Generator[Any, None, List[S]]:
+def _consume(task: asyncio.Task[Any]) -> None:
+    # Speculative fetches can be discarded without ever being awaited; retrieve their
+    # exceptions so asyncio doesn't log them as never retrieved.
+    if not task.cancelled():
+        task.exception()
+
+async def _aclose(iterator: Any) -> None:
+    # Stops whatever is upstream of a derived paginator: pending map calls of a generator, or
+    # the prefetches of a paginator.
+    aclose = getattr(iterator, 'aclose', None)
+    if aclose is not None:
+        await aclose()
+
+async def _run_concurrently(
+    source: AsyncIterator[T], func: Callable[[T], MaybeAwaitable[S]], concurrency: int, ordered: bool
+) -> AsyncIterator[Tuple[T, S]]:
+    async def call(item: T) -> Tuple[T, S]:
+        return item, await maybe_coroutine(func, item)
+
+    if concurrency <= 1:
+        try:
+            async for item in source:
+                yield await call(item)
+        finally:
+            await _aclose(source)
+
+        return
+
+    # At most `concurrency` calls are in flight; the source is only pulled from again once
+    # one of them has been handed to the consumer, so a slow consumer also stops the page
+    # fetches instead of letting results pile up.
+    pending: Deque[asyncio.Future[Tuple[T, S]]] = collections.deque()
+    try:
+        async for item in source:
+            pending.append(asyncio.ensure_future(call(item)))
+            if len(pending) < concurrency:
+                continue
+
+            if ordered:
+                yield await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+
+        while pending:
+            if ordered:
+                yield await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+        await _aclose(source)
+
+class _ItemPaginator(ABC, Generic[T]):
+    def __await__(self) -> Generator[Any, None, List[T]]:
         return self.collect().__await__()
 
-    async def __aiter__(self) -> AsyncIterator[S]:
-        async for page in self._paginator:
-            for item in page:
-                yield await maybe_coroutine(self._func, item)
-
-    async def collect(self) -> List[S]:
-        return [await maybe_coroutine(self._func, item) async for page in self._paginator for item in page]
+    @abstractmethod
+    def __aiter__(self) -> AsyncIterator[T]:
+        raise NotImplementedError
 
-class _FilteredPaginator(Generic[T]):
-    def __init__(self, paginator: AbstractAsyncPaginator[T], f: Callable[[T], MaybeAwaitable[bool]]) -> None:
-        self._paginator = paginator
+    async def collect(self) -> List[T]:
+        return [item async for item in self]
+
+    def map(
+        self, func: Callable[[T], MaybeAwaitable[S]], *, concurrency: int = 1, ordered: bool = True
+    ) -> _MappedPaginator[T, S]:
+        return _MappedPaginator(self, func, concurrency=concurrency, ordered=ordered)
+
+    def filter(
+        self, predicate: Callable[[T], MaybeAwaitable[bool]], *, concurrency: int = 1, ordered: bool = True
+    ) -> _FilteredPaginator[T]:
+        return _FilteredPaginator(self, predicate, concurrency=concurrency, ordered=ordered)
+
+    def batch(self, size: int) -> _BatchedPaginator[T]:
+        return _BatchedPaginator(self, size)
+
+    def take(self, n: int) -> _TakenPaginator[T]:
+        return _TakenPaginator(self, n)
+
+    def flatten(self: _ItemPaginator[Iterable[S]]) -> _FlattenedPaginator[S]:
+        return _FlattenedPaginator(self)
+
+class _MappedPaginator(_ItemPaginator[S], Generic[T, S]):
+    def __init__(
+        self,
+        source: AsyncIterable[T],
+        f: Callable[[T], MaybeAwaitable[S]],
+        *,
+        concurrency: int = 1,
+        ordered: bool = True
+    ) -> None:
+        self._source = source
         self._func = f
+        self.concurrency = concurrency
+        self.ordered = ordered
 
-    def __await__(self) -> Generator[Any, None, List[T]]:
-        return self.collect().__await__()
+    async def __aiter__(self) -> AsyncIterator[S]:
+        results = _run_concurrently(self._source.__aiter__(), self._func, self.concurrency, self.ordered)
+        try:
+            async for _, result in results:
+                yield result
+        finally:
+            await results.aclose()
+
+class _FilteredPaginator(_ItemPaginator[T]):
+    def __init__(
+        self,
+        source: AsyncIterable[T],
+        f: Callable[[T], MaybeAwaitable[bool]],
+        *,
+        concurrency: int = 1,
+        ordered: bool = True
+    ) -> None:
+        self._source = source
+        self._func = f
+        self.concurrency = concurrency
+        self.ordered = ordered
 
     async def __aiter__(self) -> AsyncIterator[T]:
-        async for page in self._paginator:
-            for item in page:
-                if await maybe_coroutine(self._func, item):
+        results = _run_concurrently(self._source.__aiter__(), self._func, self.concurrency, self.ordered)
+        try:
+            async for item, keep in results:
+                if keep:
                     yield item
+        finally:
+            await results.aclose()
+
+class _BatchedPaginator(_ItemPaginator[List[T]]):
+    def __init__(self, source: AsyncIterable[T], size: int) -> None:
+        if size < 1:
+            raise ValueError('size must be at least 1')
+
+        self._source = source
+        self.size = size
+
+    async def __aiter__(self) -> AsyncIterator[List[T]]:
+        iterator = self._source.__aiter__()
+        try:
+            batch: List[T] = []
+            async for item in iterator:
+                batch.append(item)
+                if len(batch) >= self.size:
+                    yield batch
+                    batch = []
+
+            if batch:
+                yield batch
+        finally:
+            await _aclose(iterator)
+
+class _TakenPaginator(_ItemPaginator[T]):
+    def __init__(self, source: AsyncIterable[T], n: int) -> None:
+        self._source = source
+        self.n = n
 
-    async def collect(self) -> List[T]:
-        return [item async for page in self._paginator for item in page if await maybe_coroutine(self._func, item)]
+    async def __aiter__(self) -> AsyncIterator[T]:
+        if self.n <= 0:
+            return
+
+        iterator = self._source.__aiter__()
+        try:
+            count = 0
+            async for item in iterator:
+                yield item
+
+                count += 1
+                if count >= self.n:
+                    break
+        finally:
+            await _aclose(iterator)
+
+class _FlattenedPaginator(_ItemPaginator[T]):
+    def __init__(self, source: AsyncIterable[Iterable[T]]) -> None:
+        self._source = source
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        iterator = self._source.__aiter__()
+        try:
+            async for items in iterator:
+                for item in items:
+                    yield item
+        finally:
+            await _aclose(iterator)
 
 class AbstractAsyncPaginator(ABC, Generic[T]):
     def __aiter__(self):
         return self
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
     async def __anext__(self) -> Page[T]:
         page = await self.next()
         if not page:
@@ -92,26 +264,46 @@ class AbstractAsyncPaginator(ABC, Generic[T]):
     async def previous(self) -> Optional[Page[T]]:
         raise NotImplementedError
 
+    async def aclose(self) -> None:
+        pass
+
     @overload
-    async def collect(self, *, with_pages: Literal[True]) -> List[Page[T]]:
+    async def collect(self, *, with_pages: Literal[True], concurrency: int = 1) -> List[Page[T]]:
         ...
     @overload
-    async def collect(self, *, with_pages: Literal[False]) -> List[T]:
+    async def collect(self, *, with_pages: Literal[False], concurrency: int = 1) -> List[T]:
         ...
     @overload
-    async def collect(self) -> List[T]:
+    async def collect(self, *, concurrency: int = 1) -> List[T]:
         ...
-    async def collect(self, *, with_pages: bool = False) -> Any:
+    async def collect(self, *, with_pages: bool = False, concurrency: int = 1) -> Any:
+        pages = await self.collect_pages(concurrency)
         if with_pages:
-            return [page async for page in self]
+            return pages
+
+        return [obj for page in pages for obj in page]
+
+    async def collect_pages(self, concurrency: int = 1) -> List[Page[T]]:
+        return [page async for page in self]
+
+    def flatten(self) -> _FlattenedPaginator[T]:
+        return _FlattenedPaginator(self)
 
-        return [obj async for page in self for obj in page]
+    def map(
+        self, func: Callable[[T], MaybeAwaitable[S]], *, concurrency: int = 1, ordered: bool = True
+    ) -> _MappedPaginator[T, S]:
+        return self.flatten().map(func, concurrency=concurrency, ordered=ordered)
 
-    def map(self, func: Callable[[T], MaybeAwaitable[S]]) -> _MappedPaginator[T, S]:
-        return _MappedPaginator(self, func)
+    def filter(
+        self, predicate: Callable[[T], MaybeAwaitable[bool]], *, concurrency: int = 1, ordered: bool = True
+    ) -> _FilteredPaginator[T]:
+        return self.flatten().filter(predicate, concurrency=concurrency, ordered=ordered)
 
-    def filter(self, predicate: Callable[[T], MaybeAwaitable[bool]]) -> _FilteredPaginator[T]:
-        return _FilteredPaginator(self, predicate)
+    def batch(self, size: int) -> _BatchedPaginator[T]:
+        return self.flatten().batch(size)
+
+    def take(self, n: int) -> _TakenPaginator[T]:
+        return self.flatten().take(n)
 
 class Page(Generic[T]):
     def __init__(self, http: HTTPHandler, model: Type[T], payload: List[Any]) -> None:
@@ -135,7 +327,7 @@ class Page(Generic[T]):
 
     def __getitem__(self, index: int) -> T:
         data = self.payload[index]
-        return self.model(data, self.http)
+        return self.http.hydrate(self.model, data)
 
     @property
     def entries(self) -> int:
@@ -148,14 +340,14 @@ class Page(Generic[T]):
         data = self.payload[self.index]
         self.index += 1
 
-        return self.model(data, self.http)
+        return self.http.hydrate(self.model, data)
 
     def current(self) -> Optional[T]:
         if self.index >= self.entries:
             return None
 
         data = self.payload[self.index]
-        return self.model(data, self.http)
+        return self.http.hydrate(self.model, data)
 
     def previous(self) -> T:
         if self.index <= 0:
@@ -164,19 +356,81 @@ class Page(Generic[T]):
             self.index -= 1
 
         data = self.payload[self.index]
-        return self.model(data, self.http)
+        return self.http.hydrate(self.model, data)
+
+class _PrefetchingPaginator(AbstractAsyncPaginator[T]):
+    http: HTTPHandler
+    prefetch: int
+    tasks: Dict[int, asyncio.Task[Any]]
+
+    # The last index there is, once a response has said so. Nothing past it gets prefetched.
+    last_page: Optional[int] = None
+
+    def __del__(self) -> None:
+        try:
+            self.cancel()
+        except (AttributeError, RuntimeError):
+            # Either __init__ never ran or the event loop is already closed.
+            pass
+
+    # Returns the request itself instead of being a coroutine method, so that a scheduled
+    # prefetch doesn't hold on to the paginator. An abandoned paginator is then collected and
+    # `__del__` cancels whatever it still had in flight. `aclose()`, or using the paginator
+    # as an async context manager, does the same deterministically.
+    @abstractmethod
+    def request(self, index: int) -> Coroutine[Any, Any, Any]:
+        raise NotImplementedError
+
+    def schedule(self, index: int) -> asyncio.Task[Any]:
+        task = self.tasks.get(index)
+        if task is None:
+            task = self.tasks[index] = self.http.loop.create_task(self.request(index))
+            task.add_done_callback(_consume)
 
-class Paginator(AbstractAsyncPaginator[T]):
-    def __init__(self, http: HTTPHandler, model: Type[T], rtype: str, query: Query, **variables: Any) -> None:
+        return task
+
+    async def fetch(self, index: int) -> Any:
+        if not self.prefetch:
+            return await self.request(index)
+
+        # Keep the requested page plus the next `prefetch` ones in flight, so that the
+        # network overlaps with whatever the consumer does with the current page.
+        stop = index + self.prefetch
+        if self.last_page is not None:
+            stop = max(index, min(stop, self.last_page))
+
+        for ahead in range(index, stop + 1):
+            self.schedule(ahead)
+
+        return await self.tasks.pop(index)
+
+    def cancel(self, after: int = -1) -> None:
+        for index in [index for index in self.tasks if index > after]:
+            self.tasks.pop(index).cancel()
+
+    async def aclose(self) -> None:
+        tasks = list(self.tasks.values())
+        self.cancel()
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+class Paginator(_PrefetchingPaginator[T]):
+    def __init__(
+        self, http: HTTPHandler, model: Type[T], rtype: str, query: Query, *, prefetch: int = 0, **variables: Any
+    ) -> None:
         self.http = http
         self.query = query
         self.rtype = rtype
         self.variables = variables
         self.model = model
+        self.prefetch = prefetch
+        self.tasks = {}
 
         self.has_next_page = True
         self.current_page = 0
         self.next_page = 1
+        self.last_page: Optional[int] = None
 
     async def fetch_page(self, page: int) -> Optional[Page[T]]:
         variables = self.variables.copy()
@@ -188,14 +442,21 @@ class Paginator(AbstractAsyncPaginator[T]):
 
         return Page(self.http, self.model, data[self.rtype])
 
+    def request(self, index: int) -> Coroutine[Any, Any, Any]:
+        variables = self.variables.copy()
+        variables['page'] = index
+
+        return self.http.request(self.query, 'Page', **variables)
+
     async def next(self) -> Optional[Page[T]]:
         if not self.has_next_page:
             return None
 
         self.variables['page'] = self.next_page
 
-        data = await self.http.request(self.query, 'Page', **self.variables)
+        data = await self.fetch(self.next_page)
         if not data:
+            self.cancel()
             return None
 
         page = data['pageInfo']
@@ -203,9 +464,46 @@ class Paginator(AbstractAsyncPaginator[T]):
         self.has_next_page = page['hasNextPage']
         self.next_page = page['currentPage'] + 1
         self.current_page = page['currentPage']
+        self.last_page = page['lastPage']
 
+        # Drop whatever was fetched speculatively past the end.
+        self.cancel(after=page['lastPage'] if self.has_next_page else self.current_page)
         return Page(self.http, self.model, data[self.rtype])
 
+    async def collect_pages(self, concurrency: int = 1) -> List[Page[T]]:
+        if concurrency <= 1:
+            return await super().collect_pages()
+
+        # The first page tells us how many there are, after which every remaining one can
+        # be requested at once and put back in order.
+        first = await self.next()
+        if first is None:
+            return []
+
+        pages = [first]
+        if self.has_next_page and self.last_page is not None:
+            indexes = range(self.next_page, self.last_page + 1)
+            results = await gather_with_concurrency(
+                concurrency, *[self.tasks.pop(index, None) or self.request(index) for index in indexes]
+            )
+
+            for data in results:
+                if not data or not data[self.rtype]:
+                    self.has_next_page = False
+                    break
+
+                page = data['pageInfo']
+
+                self.has_next_page = page['hasNextPage']
+                self.next_page = page['currentPage'] + 1
+                self.current_page = page['currentPage']
+
+                pages.append(Page(self.http, self.model, data[self.rtype]))
+
+        # In case more pages showed up while we were fetching.
+        pages.extend([page async for page in self])
+        return pages
+
     async def current(self) -> Optional[Page[T]]:
         data = await self.http.request(self.query, 'Page', **self.variables)
         if not data:
@@ -229,8 +527,10 @@ class Paginator(AbstractAsyncPaginator[T]):
 
         return Page(self.http, self.model, data[self.rtype])
 
-class ChunkPaginator(AbstractAsyncPaginator[T]):
-    def __init__(self, http: HTTPHandler, model: Type[T], rtype: str, query: Query, **variables: Any) -> None:
+class ChunkPaginator(_PrefetchingPaginator[T]):
+    def __init__(
+        self, http: HTTPHandler, model: Type[T], rtype: str, query: Query, *, prefetch: int = 0, **variables: Any
+    ) -> None:
         self.http = http
         self.model = model
         self.variables = variables
@@ -238,6 +538,14 @@ class ChunkPaginator(AbstractAsyncPaginator[T]):
         self.query = query
         self.chunks: Dict[int, Any] = {}
         self.has_next_chunk = True
+        self.prefetch = prefetch
+        self.tasks = {}
+
+    def request(self, index: int) -> Coroutine[Any, Any, Any]:
+        variables = self.variables.copy()
+        variables['chunk'] = index
+
+        return self.http.request(self.query, self.rtype, **variables)
 
     async def fetch_chunk(self, chunk: int) -> Optional[Page[T]]:
         variables = self.variables.copy()
@@ -260,16 +568,39 @@ class ChunkPaginator(AbstractAsyncPaginator[T]):
         if not self.has_next_chunk:
             return None
 
-        data = await self.http.request(self.query, self.rtype, **self.variables)
-        if not data:
+        data = await self.fetch(self.variables['chunk'])
+        if not data or not data['lists']:
             self.has_next_chunk = False
+            self.cancel()
+
             return None
 
         self.has_next_chunk = data['hasNextChunk']
+        if not self.has_next_chunk:
+            self.cancel()
+
         self.variables['chunk'] += 1
 
         return Page(self.http, self.model, data['lists'])
 
+    async def collect_pages(self, concurrency: int = 1) -> List[Page[T]]:
+        if concurrency <= 1:
+            return await super().collect_pages()
+
+        # Chunks don't say how many there are, so keep `concurrency` of them in flight
+        # speculatively; whatever overshoots the last one gets cancelled by `next`.
+        prefetch = self.prefetch
+        self.prefetch = max(prefetch, concurrency - 1)
+
+        try:
+            return await super().collect_pages()
+        finally:
+            self.prefetch = prefetch
+
+    def entries(self) -> _FlattenedPaginator[Any]:
+        # Every entry of every list, in order, across however many chunks there are.
+        return self.flatten().map(lambda group: group.entries).flatten()
+
     async def previous(self) -> Optional[Page[T]]:
         if not self.variables['chunk']:
             return None
@@ -8,19 +8,101 @@ __all__ = (
     'QueryOperation',
     'QueryFields',
     'QueryField',
-    'Query'
+    'QueryFragment',
+    'Query',
+    'MAX_QUERY_COMPLEXITY',
 )
 
+# AniList rejects any document whose cost, as scored by the server, is higher than this.
+MAX_QUERY_COMPLEXITY = 500
+
 class QueryIncomplete(Exception):
     def __init__(self, element: str) -> None:
         super().__init__(f'Query missing {element!r} element')
 
+def _write_arguments(buffer: List[str], arguments: Dict[str, Any]) -> None:
+    buffer.append('(' + ','.join([f'{key}:{value}' for key, value in arguments.items()]) + ')')
+
+def _write_selection(buffer: List[str], fields: List[QueryField]) -> None:
+    buffer.append('{')
+
+    first = True
+    for field in fields:
+        # Names only need separating from each other, never from a closing brace or parenthesis
+        # before them. Blocks of items are appended whole, so the last character is what counts.
+        if not first and buffer[-1][-1] not in '})':
+            buffer.append(' ')
+
+        field.write(buffer)
+        first = False
+
+    buffer.append('}')
+
+def _resolve(value: Any, variables: Dict[str, Any]) -> Any:
+    if isinstance(value, str) and value.startswith('$'):
+        return variables.get(value[1:])
+
+    return value
+
+def _page_size(arguments: Dict[str, Any], variables: Dict[str, Any]) -> int:
+    value = _resolve(arguments.get('perPage'), variables)
+    return value if isinstance(value, int) and value > 0 else 1
+
+def _is_included(field: QueryField, variables: Dict[str, Any]) -> bool:
+    # A condition whose variable isn't given is counted as met, better to overestimate.
+    include = field.directives.get('include')
+    if include is not None and _resolve(include['if'], variables) is False:
+        return False
+
+    skip = field.directives.get('skip')
+    return skip is None or _resolve(skip['if'], variables) is not True
+
+def _complexity(
+    fields: List[QueryField], fragments: Dict[str, QueryFragment], variables: Dict[str, Any], size: int
+) -> int:
+    # A rough estimate, not AniList's own scoring. Every field costs one plus whatever it
+    # selects, and `size` comes from the `perPage` of the parent and multiplies each list
+    # below it, like `media` in a Page or `nodes` in a connection. Lists that aren't given a
+    # size are counted once.
+    total = 0
+    for field in fields:
+        if field.directives and not _is_included(field, variables):
+            continue
+
+        # Inline fragments and spreads only stand in for the fields they contain.
+        if field.name == '...':
+            total += _complexity(field.fields, fragments, variables, size)
+            continue
+
+        if field.name.startswith('...'):
+            total += _complexity(fragments[field.name[3:]].fields, fragments, variables, size)
+            continue
+
+        cost = 1 + len(field.items)
+        if field.fields:
+            cost += _complexity(field.fields, fragments, variables, _page_size(field.arguments, variables))
+
+        if (field.fields or field.items) and field.name != 'pageInfo':
+            cost *= size
+
+        total += cost
+
+    return total
+
 class AbstractQueryElement(ABC):
     def __str__(self) -> str:
         return self.build()
 
-    @abstractmethod
     def build(self) -> str:
+        # The whole tree is written into one buffer and joined once, instead of every node
+        # building and concatenating the strings of its children.
+        buffer: List[str] = []
+        self.write(buffer)
+
+        return ''.join(buffer)
+
+    @abstractmethod
+    def write(self, buffer: List[str]) -> None:
         raise NotImplementedError
 
 class QueryOperation(AbstractQueryElement):
@@ -32,18 +114,11 @@ class QueryOperation(AbstractQueryElement):
     def __repr__(self) -> str:
         return f'<QueryOperation type={self.type!r} name={self.name!r}>'
 
-    def build(self):
-        vars = ', '.join([f'{k}: {v}' for k, v in self.variables.items()])
-
-        if self.name:
-            operation = f'{self.type} {self.name}'
-        else:
-            operation = f'{self.type}'
+    def write(self, buffer: List[str]) -> None:
+        buffer.append(f'{self.type} {self.name}' if self.name else self.type)
 
         if self.variables:
-            operation += f'({vars})'
-
-        return operation
+            _write_arguments(buffer, self.variables)
 
 class QueryField(AbstractQueryElement):
     def __init__(self, name: str, *items: str, **arguments: Any) -> None:
@@ -51,6 +126,7 @@ class QueryField(AbstractQueryElement):
         self.arguments = arguments
         self.items = list(items)
         self.fields: List[QueryField] = []
+        self.directives: Dict[str, Dict[str, Any]] = {}
 
     def __repr__(self) -> str:
         return f'<QueryField name={self.name!r}>'
@@ -61,56 +137,87 @@ class QueryField(AbstractQueryElement):
 
         return field
 
-    def build(self):
-        args = ', '.join([f'{k}: {v}' for k, v in self.arguments.items()])
-        fields = ' '.join([field.build() for field in self.fields])
-        items = ' '.join(self.items)
+    def add_spread(self, fragment: QueryFragment):
+        return self.add_field('...' + fragment.name)
+
+    def add_directive(self, name: str, **arguments: Any):
+        self.directives[name] = arguments
+        return self
+
+    def write(self, buffer: List[str]) -> None:
+        buffer.append(self.name)
 
-        query = self.name
         if self.arguments:
-            query += f' ({args})'
+            _write_arguments(buffer, self.arguments)
+
+        for name, arguments in self.directives.items():
+            buffer.append('@' + name)
+            if arguments:
+                _write_arguments(buffer, arguments)
 
         if self.fields:
-            query += ' { ' + fields + ' }'
+            _write_selection(buffer, self.fields)
         elif self.items:
-            query += ' { ' + items + ' }'
-        elif self.items and self.fields:
-            query += ' { ' + fields + items + ' }'
-
-        return query
+            buffer.append('{' + ' '.join(self.items) + '}')
 
 class QueryFields(AbstractQueryElement):
-    def __init__(self, name: str, fields: Optional[List[QueryField]] = None, **arguments: Any) -> None:
+    def __init__(
+        self, name: str, fields: Optional[List[QueryField]] = None, *, alias: Optional[str] = None, **arguments: Any
+    ) -> None:
         self.name = name
+        self.alias = alias
         self.fields = fields or []
         self.arguments = arguments
     
     def __repr__(self) -> str:
-        return f'<QueryFields name={self.name!r}>'
+        return f'<QueryFields name={self.name!r} alias={self.alias!r}>'
 
     def add_field(self, name: str, *items: str, **arguments: Any):
         field = QueryField(name, *items, **arguments)
         self.fields.append(field)
 
         return field
+
+    def add_spread(self, fragment: QueryFragment):
+        return self.add_field('...' + fragment.name)
     
-    def build(self):
-        fields = ' '.join([field.build() for field in self.fields])
-        args = ', '.join([f'{k}: {v}' for k, v in self.arguments.items()])
+    def write(self, buffer: List[str]) -> None:
+        buffer.append(f'{self.alias}:{self.name}' if self.alias else self.name)
 
-        query = f'{self.name}'
         if self.arguments:
-            query += f'({args}) '
+            _write_arguments(buffer, self.arguments)
+
+        if self.fields:
+            _write_selection(buffer, self.fields)
+
+class QueryFragment(AbstractQueryElement):
+    def __init__(self, name: str, type: str, fields: Optional[List[QueryField]] = None) -> None:
+        self.name = name
+        self.type = type
+        self.fields = fields or []
+
+    def __repr__(self) -> str:
+        return f'<QueryFragment name={self.name!r} type={self.type!r}>'
+
+    def add_field(self, name: str, *items: str, **arguments: Any):
+        field = QueryField(name, *items, **arguments)
+        self.fields.append(field)
+
+        return field
 
-        if fields:
-            query +=  '{ ' + fields + ' }'
+    def add_spread(self, fragment: QueryFragment):
+        return self.add_field('...' + fragment.name)
 
-        return query
+    def write(self, buffer: List[str]) -> None:
+        buffer.append(f'fragment {self.name} on {self.type}')
+        _write_selection(buffer, self.fields)
 
 class Query(AbstractQueryElement):
     def __init__(self, *, operation: Optional[QueryOperation] = None, fields: Optional[QueryFields] = None) -> None:
         self._operation = operation
-        self._fields = fields
+        self._document: Optional[str] = None
+        self.roots: List[QueryFields] = [fields] if fields else []
+        self.fragments: Dict[str, QueryFragment] = {}
 
     @property
     def operation(self):
@@ -122,34 +229,75 @@ class Query(AbstractQueryElement):
             raise TypeError('operation value must be an instance of QueryOperation')
 
         self._operation = value
+        self._document = None
 
     @property
-    def fields(self):
-        return self._fields
+    def fields(self) -> Optional[QueryFields]:
+        return self.roots[0] if self.roots else None
 
     @fields.setter
     def fields(self, value: QueryFields):
         if not isinstance(value, QueryFields):
             raise TypeError('fields value must be an instance of QueryFields')
 
-        self._fields = value
+        self.roots = [value]
+        self._document = None
 
     def set_operation(self, type: str, *, name: Optional[str] = None, variables: Dict[str, str]):
         operation = QueryOperation(type, name=name, variables=variables)
-        self._operation = operation
+        self.operation = operation
 
         return operation
     
     def add_fields(self, name: str, fields: Optional[List[QueryField]] = None, **arguments) -> QueryFields:
-        self.fields = QueryFields(name, fields, **arguments)
-        return self.fields
+        self.fields = fields = QueryFields(name, fields, **arguments)
+        return fields
 
-    def build(self) -> str:
-        if not self.operation or not self.fields:
+    def add_root(self, fields: QueryFields) -> QueryFields:
+        if not isinstance(fields, QueryFields):
+            raise TypeError('fields value must be an instance of QueryFields')
+
+        self.roots.append(fields)
+        self._document = None
+
+        return fields
+
+    def add_fragment(self, fragment: QueryFragment) -> QueryFragment:
+        if not isinstance(fragment, QueryFragment):
+            raise TypeError('fragment value must be an instance of QueryFragment')
+
+        self.fragments[fragment.name] = fragment
+        self._document = None
+
+        return fragment
+
+    def write(self, buffer: List[str]) -> None:
+        if not self.operation:
             raise QueryIncomplete('operation')
 
-        query = self.operation.build() + '{ '
-        query += self.fields.build()
+        if not self.roots:
+            raise QueryIncomplete('fields')
+
+        self.operation.write(buffer)
+        _write_selection(buffer, self.roots) # type: ignore
+
+        for fragment in self.fragments.values():
+            fragment.write(buffer)
+
+    def complexity(self, variables: Optional[Dict[str, Any]] = None) -> int:
+        variables = variables or {}
+
+        total = 0
+        for root in self.roots:
+            total += 1 + _complexity(root.fields, self.fragments, variables, _page_size(root.arguments, variables))
+
+        return total
 
-        return query + ' }'
+    def compile(self) -> str:
+        # Unlike build(), the document is only serialized once. Replacing the operation or
+        # the root fields invalidates it, but changes made to the field tree in place are
+        # not picked up.
+        if self._document is None:
+            self._document = self.build()
 
+        return self._document
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Mapping, Optional
+from contextlib import asynccontextmanager
+import asyncio
+import time
+
+__all__ = (
+    'RateLimiter',
+)
+
+class RateLimiter:
+    def __init__(self, *, max_concurrency: int = 10, per_minute: int = 90) -> None:
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+
+        if per_minute < 1:
+            raise ValueError('per_minute must be at least 1')
+
+        self.max_concurrency = max_concurrency
+        self.per_minute = per_minute
+
+        self.tokens = float(per_minute)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f'<RateLimiter max_concurrency={self.max_concurrency} per_minute={self.per_minute} tokens={self.tokens:.2f}>'
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.per_minute, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def wait(self) -> None:
+        # Waiters queue up on the lock so tokens are handed out in FIFO order.
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if self.blocked_until > now:
+                    await asyncio.sleep(self.blocked_until - now)
+
+                    # The server-side window has been reset by the time a block expires.
+                    self.tokens = self.per_minute
+                    self.updated_at = time.monotonic()
+                    continue
+
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        async with self.semaphore:
+            await self.wait()
+            yield
+
+    def block(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def update(self, headers: Mapping[str, Any]) -> None:
+        limit = headers.get('X-RateLimit-Limit')
+        if limit is not None:
+            self.per_minute = max(int(limit), 1)
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+
+        # The server's view of our budget wins over the local estimate whenever it is
+        # lower, e.g. when several clients share the same IP or token.
+        self._refill()
+        self.tokens = min(self.tokens, float(remaining))
+
+        if int(remaining) > 0:
+            return
+
+        reset: Optional[str] = headers.get('X-RateLimit-Reset')
+        if reset is not None:
+            self.block(max(float(reset) - time.time(), 0))
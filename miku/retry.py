@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import Collection, Optional
+import asyncio
+import random
+
+import aiohttp
+
+from .errors import HTTPException
+
+__all__ = (
+    'RetryBudget',
+    'RetryPolicy',
+)
+
+class RetryBudget:
+    def __init__(self, *, ratio: float = 0.1, max_tokens: float = 10) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def __repr__(self) -> str:
+        return f'<RetryBudget ratio={self.ratio} tokens={self.tokens:.2f}>'
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+# Shared by every policy that isn't given its own budget, so that all the clients in a
+# process back off together once AniList starts failing instead of each retrying on its own.
+GLOBAL_RETRY_BUDGET = RetryBudget()
+
+class RetryPolicy:
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 4,
+        max_throttled_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30,
+        jitter: bool = True,
+        statuses: Collection[int] = (500, 502, 503, 504),
+        budget: Optional[RetryBudget] = None
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+
+        if max_throttled_retries < 0:
+            raise ValueError('max_throttled_retries must be at least 0')
+
+        self.max_attempts = max_attempts
+        self.max_throttled_retries = max_throttled_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.budget = budget or GLOBAL_RETRY_BUDGET
+
+    def __repr__(self) -> str:
+        return f'<RetryPolicy max_attempts={self.max_attempts} base_delay={self.base_delay} max_delay={self.max_delay}>'
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        if self.jitter:
+            # "Full jitter", which spreads retries from many clients over the whole window.
+            delay = random.uniform(0, delay)
+
+        return delay
+
+    def is_retryable(self, error: BaseException, idempotent: bool) -> bool:
+        if isinstance(error, HTTPException):
+            # A throttled request was never processed, so it's safe to send again even if
+            # it isn't idempotent.
+            if error.status == 429:
+                return True
+
+            return idempotent and error.status in self.statuses
+
+        if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)):
+            return idempotent
+
+        return False
+
+    def should_retry(self, error: BaseException, attempt: int, idempotent: bool, throttled: int = 0) -> bool:
+        # Throttled requests are already paced by the rate limiter, which holds them back until
+        # the server's window resets, so they neither count as attempts nor spend the budget.
+        # `throttled` is how many times the request was throttled so far, capped on its own so
+        # that a server which never lets up fails the request instead of holding it forever.
+        if isinstance(error, HTTPException) and error.status == 429:
+            return throttled <= self.max_throttled_retries
+
+        if attempt >= self.max_attempts or not self.is_retryable(error, idempotent):
+            return False
+
+        return self.budget.withdraw()
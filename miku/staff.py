@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from .character import Character
 from .image import Image
@@ -21,6 +21,10 @@ class Staff(IDComparable):
         '_payload',
         '_http',
         '_cs_characters',
+        '_cs_name',
+        '_cs_image',
+        '_cs_birth',
+        '_cs_death',
         'id',
         'language',
         'description',
@@ -35,35 +39,42 @@ class Staff(IDComparable):
         self._payload = payload
         self._http = http
 
-        self.id: int = self._payload['id']
-        self.language: str = self._payload['languageV2']
-        self.description: str = self._payload['description']
-        self.primary_occupations: List[str] = self._payload['primaryOccupations']
-        self.gender: str = self._payload['gender']
-        self.age: int = self._payload['age']
-        self.home_town: str = self._payload['homeTown']
-        self.url: str = self._payload['siteUrl']
+        # Every key is optional since callers can choose which fields get requested.
+        self.id: int = self._payload.get('id')
+        self.language: str = self._payload.get('languageV2')
+        self.description: str = self._payload.get('description')
+        self.primary_occupations: List[str] = self._payload.get('primaryOccupations', [])
+        self.gender: str = self._payload.get('gender')
+        self.age: int = self._payload.get('age')
+        self.home_town: str = self._payload.get('homeTown')
+        self.url: str = self._payload.get('siteUrl')
 
     def __repr__(self) -> str:
-        return f'<Staff id={self.id} name={self.name.full!r}>'
+        name = self.name
+        return f'<Staff id={self.id} name={name.full if name else None!r}>'
 
-    @property
-    def name(self) -> Name:
-        return Name(self._payload['name'])
+    @cached_slot_property('_cs_name')
+    def name(self) -> Optional[Name]:
+        name = self._payload.get('name')
+        return Name(name) if name else None
 
-    @property
-    def image(self) -> Image:
-        return Image(self._http.session, self._payload['image']) # type: ignore
+    @cached_slot_property('_cs_image')
+    def image(self) -> Optional[Image]:
+        image = self._payload.get('image')
+        return Image(self._http.session, image) if image else None # type: ignore
 
-    @property
-    def birth(self) -> FuzzyDate:
-        return FuzzyDate(self._payload['dateOfBirth'])
+    @cached_slot_property('_cs_birth')
+    def birth(self) -> Optional[FuzzyDate]:
+        birth = self._payload.get('dateOfBirth')
+        return FuzzyDate(birth) if birth else None
 
-    @property
-    def death(self) -> FuzzyDate:
-        return FuzzyDate(self._payload['dateOfDeath'])
+    @cached_slot_property('_cs_death')
+    def death(self) -> Optional[FuzzyDate]:
+        death = self._payload.get('dateOfDeath')
+        return FuzzyDate(death) if death else None
 
     @cached_slot_property('_cs_characters')
     def characters(self) -> List[Character]:
-        return [Character(character, self._http) for character in self._payload['characters']['nodes']]
+        characters = self._payload.get('characters', {}).get('nodes', [])
+        return [self._http.hydrate(Character, character) for character in characters]
 
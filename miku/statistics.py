@@ -1,6 +1,7 @@
 from typing import List
 import datetime
 
+from .utils import cached_slot_property
 from . import types
 
 __all__ = (
@@ -9,7 +10,7 @@ __all__ = (
 )
 
 class SiteTrend:
-    __slots__ = ('_payload', 'count', 'change')
+    __slots__ = ('_payload', '_cs_date', 'count', 'change')
 
     def __init__(self, payload: types.SiteTrend) -> None:
         self._payload = payload
@@ -17,7 +18,7 @@ class SiteTrend:
         self.count: int = payload['count']
         self.change: int = payload['change']
     
-    @property
+    @cached_slot_property('_cs_date')
     def date(self) -> datetime.datetime:
         return datetime.datetime.utcfromtimestamp(self._payload['date'])
     
@@ -25,42 +26,51 @@ class SiteTrend:
         return '<SiteTrend count={0.count} change={0.change}>'.format(self)
 
 class SiteStatistics:
-    __slots__ = ('_payload',)
+    __slots__ = (
+        '_payload',
+        '_cs_users',
+        '_cs_anime',
+        '_cs_manga',
+        '_cs_characters',
+        '_cs_studios',
+        '_cs_staff',
+        '_cs_reviews',
+    )
 
     def __init__(self, payload: types.SiteStatistics) -> None:
         self._payload = payload
 
-    @property
+    @cached_slot_property('_cs_users')
     def users(self) -> List[SiteTrend]:
         users = self._payload['users']['nodes']
         return [SiteTrend(user) for user in users]
 
-    @property
+    @cached_slot_property('_cs_anime')
     def anime(self) -> List[SiteTrend]:
         users = self._payload['anime']['nodes']
         return [SiteTrend(user) for user in users]
 
-    @property
+    @cached_slot_property('_cs_manga')
     def manga(self) -> List[SiteTrend]:
         users = self._payload['manga']['nodes']
         return [SiteTrend(user) for user in users]
 
-    @property
+    @cached_slot_property('_cs_characters')
     def characters(self) -> List[SiteTrend]:
         users = self._payload['characters']['nodes']
         return [SiteTrend(user) for user in users]
 
-    @property
+    @cached_slot_property('_cs_studios')
     def studios(self) -> List[SiteTrend]:
         users = self._payload['studios']['nodes']
         return [SiteTrend(user) for user in users]
 
-    @property
+    @cached_slot_property('_cs_staff')
     def staff(self) -> List[SiteTrend]:
         users = self._payload['staff']['nodes']
         return [SiteTrend(user) for user in users]
 
-    @property
+    @cached_slot_property('_cs_reviews')
     def reviews(self) -> List[SiteTrend]:
         users = self._payload['reviews']['nodes']
         return [SiteTrend(user) for user in users]
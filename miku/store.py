@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+import time
+
+from .cache import CacheStats
+
+__all__ = (
+    'ENTITY_TYPES',
+    'EntityStore',
+)
+
+# The GraphQL types that get normalized, i.e. ones that have an `id` and their own root query.
+ENTITY_TYPES = frozenset(('Media', 'Character', 'Staff', 'Studio', 'User'))
+
+def _merge(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    # Never mutates either side since both may already be held by a model.
+    merged = dict(old)
+    for key, value in new.items():
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            value = _merge(current, value)
+
+        merged[key] = value
+
+    return merged
+
+def _covers(value: Any, selection: Any) -> bool:
+    if value is None:
+        return True
+
+    if isinstance(value, list):
+        return all(_covers(item, selection) for item in value)
+
+    if isinstance(selection, dict):
+        selection = (selection,)
+
+    for field in selection:
+        if isinstance(field, dict):
+            name = next(iter(field))
+            if name not in value or not _covers(value[name], field[name]):
+                return False
+        elif field not in value:
+            return False
+
+    return True
+
+class EntityStore:
+    def __init__(self, *, max_entries: int = 10000, max_age: Optional[float] = None) -> None:
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self.entities: OrderedDict[Tuple[str, Any], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def __repr__(self) -> str:
+        return f'<EntityStore entries={len(self.entities)} stats={self.stats!r}>'
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def get(self, typename: str, id: Any) -> Optional[Dict[str, Any]]:
+        entry = self.entities.get((typename, id))
+        if entry is None:
+            return None
+
+        updated_at, record = entry
+        if self.max_age is not None and time.monotonic() - updated_at > self.max_age:
+            del self.entities[(typename, id)]
+            return None
+
+        return record
+
+    def resolve(self, typename: str, id: Any, selection: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        record = self.get(typename, id)
+        if record is None or not _covers(record, selection):
+            self.stats.misses += 1
+            return None
+
+        self.entities.move_to_end((typename, id))
+        self.stats.hits += 1
+
+        return record
+
+    def merge(self, typename: str, id: Any, payload: Dict[str, Any]) -> Dict[str, Any]:
+        key = (typename, id)
+
+        entry = self.entities.get(key)
+        record = _merge(entry[1], payload) if entry is not None else payload
+
+        self.entities[key] = (time.monotonic(), record)
+        self.entities.move_to_end(key)
+
+        while len(self.entities) > self.max_entries:
+            self.entities.popitem(last=False)
+            self.stats.evictions += 1
+
+        return record
+
+    def normalize(self, value: Any) -> None:
+        if isinstance(value, list):
+            for item in value:
+                self.normalize(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                if isinstance(item, (dict, list)):
+                    self.normalize(item)
+
+            typename = value.get('__typename')
+            if typename in ENTITY_TYPES and value.get('id') is not None:
+                self.merge(typename, value['id'], value)
+
+    def evict(self, typename: str, id: Any) -> None:
+        self.entities.pop((typename, id), None)
+
+    def clear(self) -> None:
+        self.entities.clear()
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional, Tuple, Union
+import re
+
+__all__ = (
+    'JSONPath',
+    'JSONStreamScanner',
+)
+
+JSONPath = Tuple[Union[str, int], ...]
+
+_WHITESPACE = b' \t\r\n'
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Everything up to the next bracket, skipping over complete strings. Stops at the opening
+# quote of a string that hasn't been fully received yet.
+_NON_BRACKETS = re.compile(rb'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*', re.DOTALL)
+_SCALAR_END = re.compile(rb'[,}\]\s]')
+
+class _Frame:
+    __slots__ = ('container', 'key', 'expects_key')
+
+    def __init__(self, container: int) -> None:
+        self.container = container
+        self.key: Union[str, int] = 0
+        self.expects_key = container == ord('{')
+
+# Picks values out of a JSON document as it arrives in chunks. Only the envelope around
+# the wanted values is tokenized, each value whose path matches `predicate` is cut out as
+# raw bytes and decoded on its own, and nothing else of the document is kept around.
+class JSONStreamScanner:
+    def __init__(self, predicate: Callable[[JSONPath], bool], decode: Callable[[bytes], Any]) -> None:
+        self.predicate = predicate
+        self.decode = decode
+
+        self.buffer = bytearray()
+        self.pos = 0
+        self.stack: List[_Frame] = []
+
+        # Set while a wanted container is being cut out: where it starts, how far it has
+        # been scanned and how deeply nested that point is.
+        self.capture: Optional[Tuple[JSONPath, int]] = None
+        self.capture_pos = 0
+        self.capture_depth = 0
+
+    @property
+    def path(self) -> JSONPath:
+        return tuple(frame.key for frame in self.stack)
+
+    def feed(self, data: bytes) -> List[Tuple[JSONPath, Any]]:
+        self.buffer += data
+        values: List[Tuple[JSONPath, Any]] = []
+
+        while self._step(values):
+            pass
+
+        # Drop whatever has been consumed so the buffer only ever holds the value in progress.
+        start = self.capture[1] if self.capture is not None else self.pos
+        if start:
+            del self.buffer[:start]
+
+            self.pos -= start
+            self.capture_pos -= start
+            if self.capture is not None:
+                self.capture = (self.capture[0], 0)
+
+        return values
+
+    def close(self) -> List[Tuple[JSONPath, Any]]:
+        values: List[Tuple[JSONPath, Any]] = []
+
+        # A bare scalar at the very end of the document has nothing after it to end it.
+        self.buffer += b' '
+        while self._step(values):
+            pass
+
+        if self.stack or self.capture is not None or self.buffer[self.pos:].strip():
+            raise ValueError('Incomplete JSON document')
+
+        return values
+
+    def _emit(self, values: List[Tuple[JSONPath, Any]], path: JSONPath, start: int, end: int) -> None:
+        values.append((path, self.decode(bytes(self.buffer[start:end]))))
+
+    def _find_string_end(self, index: int) -> int:
+        # `index` points at the opening quote, returns one past the closing one or -1.
+        match = _STRING.match(self.buffer, index)
+        return match.end() if match is not None else -1
+
+    def _scan_capture(self, values: List[Tuple[JSONPath, Any]]) -> bool:
+        assert self.capture is not None
+
+        buffer = self.buffer
+        length = len(buffer)
+
+        while True:
+            index = _NON_BRACKETS.match(buffer, self.capture_pos).end() # type: ignore
+            self.capture_pos = index
+
+            if index >= length or buffer[index] == ord('"'):
+                return False
+
+            char = buffer[index]
+            self.capture_pos = index + 1
+            if char in b'{[':
+                self.capture_depth += 1
+                continue
+
+            self.capture_depth -= 1
+            if self.capture_depth == 0:
+                path, start = self.capture
+                self._emit(values, path, start, self.capture_pos)
+
+                self.pos = self.capture_pos
+                self.capture = None
+
+                return True
+
+    def _step(self, values: List[Tuple[JSONPath, Any]]) -> bool:
+        if self.capture is not None:
+            return self._scan_capture(values)
+
+        buffer = self.buffer
+        length = len(buffer)
+
+        pos = self.pos
+        while pos < length and buffer[pos] in _WHITESPACE:
+            pos += 1
+
+        self.pos = pos
+        if pos >= length:
+            return False
+
+        char = buffer[pos]
+        frame = self.stack[-1] if self.stack else None
+
+        if char == ord(','):
+            assert frame is not None
+            if frame.container == ord('{'):
+                frame.expects_key = True
+            else:
+                frame.key = int(frame.key) + 1
+
+            self.pos += 1
+            return True
+
+        if char == ord(':'):
+            assert frame is not None
+            frame.expects_key = False
+
+            self.pos += 1
+            return True
+
+        if char in b'}]':
+            self.stack.pop()
+            self.pos += 1
+            return True
+
+        if char == ord('"') and frame is not None and frame.expects_key:
+            end = self._find_string_end(pos)
+            if end == -1:
+                return False
+
+            frame.key = self.decode(bytes(buffer[pos:end]))
+            self.pos = end
+            return True
+
+        # Anything else starts a value.
+        path = self.path
+        wanted = self.predicate(path)
+
+        if char in b'{[':
+            if wanted:
+                self.capture = (path, pos)
+                self.capture_pos = pos + 1
+                self.capture_depth = 1
+            else:
+                self.stack.append(_Frame(char))
+                self.pos = pos + 1
+
+            return True
+
+        if char == ord('"'):
+            end = self._find_string_end(pos)
+        else:
+            match = _SCALAR_END.search(buffer, pos)
+            end = match.start() if match is not None else -1
+
+        if end == -1:
+            return False
+
+        if wanted:
+            self._emit(values, path, pos, end)
+
+        self.pos = end
+        return True
@@ -15,7 +15,7 @@ class Studio(IDComparable):
     __slots__ = (
         '_payload',
         '_http',
-        '_cs_media'
+        '_cs_media',
         'id',
         'name',
         'is_animation_studio',
@@ -27,17 +27,18 @@ class Studio(IDComparable):
         self._payload = payload
         self._http = http
 
-        self.id: int = payload['id']
-        self.name: str = payload['name']
-        self.is_animation_studio: bool = payload['isAnimationStudio']
-        self.url: str = payload['siteUrl']
-        self.favourites: int = payload['favourites']
+        # Every key is optional since callers can choose which fields get requested.
+        self.id: int = payload.get('id')
+        self.name: str = payload.get('name')
+        self.is_animation_studio: bool = payload.get('isAnimationStudio')
+        self.url: str = payload.get('siteUrl')
+        self.favourites: int = payload.get('favourites')
 
     def __repr__(self) -> str:
         return f'<Studio id={self.id} name={self.name!r}>'
 
     @cached_slot_property('_cs_media')
     def medias(self) -> List[Media]:
-        medias = self._payload['media']['nodes']
-        return [Media(media, self._http) for media in medias]
+        medias = self._payload.get('media', {}).get('nodes', [])
+        return [self._http.hydrate(Media, media) for media in medias]
 
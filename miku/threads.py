@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 import datetime
 
 from .user import User
@@ -32,6 +32,11 @@ class ThreadComment(IDComparable):
         '_payload',
         '_http',
         '_cs_children',
+        '_cs_created_at',
+        '_cs_updated_at',
+        '_cs_thread',
+        '_cs_user',
+        '_cs_likes',
         'id',
         'user_id',
         'thread_id',
@@ -56,29 +61,31 @@ class ThreadComment(IDComparable):
     def __repr__(self) -> str:
         return f'<ThreadComment id={self.id} user_id={self.user_id} thread_id={self.thread_id}>'
 
-    @property
+    @cached_slot_property('_cs_created_at')
     def created_at(self) -> datetime.datetime:
         return datetime.datetime.utcfromtimestamp(self._payload['createdAt'])
 
-    @property
+    @cached_slot_property('_cs_updated_at')
     def updated_at(self) -> datetime.datetime:
         return datetime.datetime.utcfromtimestamp(self._payload['updatedAt'])
 
-    @property
-    def thread(self) -> Thread:
-        return Thread(self._payload['thread'], self._http)
+    @cached_slot_property('_cs_thread')
+    def thread(self) -> Optional[Thread]:
+        thread = self._payload['thread']
+        return self._http.hydrate(Thread, thread) if thread is not None else None
 
-    @property
-    def user(self) -> User:
-        return User(self._payload['user'], self._http)
+    @cached_slot_property('_cs_user')
+    def user(self) -> Optional[User]:
+        user = self._payload['user']
+        return self._http.hydrate(User, user) if user is not None else None
 
-    @property
+    @cached_slot_property('_cs_likes')
     def likes(self) -> List[User]:
-        return [User(like, self._http) for like in self._payload['likes']]
+        return [self._http.hydrate(User, like) for like in self._payload['likes']]
     
     @cached_slot_property('_cs_children')
     def children(self) -> List[ThreadComment]:
-        return [ThreadComment(child, self._http) for child in self._payload['childComments']]
+        return [self._http.hydrate(ThreadComment, child) for child in self._payload['childComments']]
 
 class Thread(IDComparable):
     __slots__ = (
@@ -86,6 +93,12 @@ class Thread(IDComparable):
         '_http',
         '_cs_likes',
         '_cs_media_categories',
+        '_cs_replied_at',
+        '_cs_created_at',
+        '_cs_updated_at',
+        '_cs_categories',
+        '_cs_owner',
+        '_cs_reply_user',
         'id',
         'url',
         'title',
@@ -124,39 +137,41 @@ class Thread(IDComparable):
     def __repr__(self) -> str:
         return f'<Thread id={self.id} is_locked={self.is_locked}>'
 
-    @property
+    @cached_slot_property('_cs_replied_at')
     def replied_at(self):
         return datetime.datetime.utcfromtimestamp(self._payload['repliedAt'])
 
-    @property
+    @cached_slot_property('_cs_created_at')
     def created_at(self):
         return datetime.datetime.utcfromtimestamp(self._payload['createdAt'])
 
-    @property
+    @cached_slot_property('_cs_updated_at')
     def updated_at(self):
         return datetime.datetime.utcfromtimestamp(self._payload['updatedAt'])
 
-    @property
+    @cached_slot_property('_cs_categories')
     def categories(self) -> List[ThreadCategory]:
         return [ThreadCategory(c) for c in self._payload['categories']]
 
-    @property
-    def owner(self) -> User:
-        return User(self._payload['user'], self._http)
+    @cached_slot_property('_cs_owner')
+    def owner(self) -> Optional[User]:
+        owner = self._payload['user']
+        return self._http.hydrate(User, owner) if owner is not None else None
 
-    @property
-    def reply_user(self) -> User:
-        return User(self._payload['replyUser'], self._http)
+    @cached_slot_property('_cs_reply_user')
+    def reply_user(self) -> Optional[User]:
+        reply_user = self._payload['replyUser']
+        return self._http.hydrate(User, reply_user) if reply_user is not None else None
 
     @cached_slot_property('_cs_likes')
     def likes(self) -> List[User]:
-        return [User(like, self._http) for like in self._payload['likes']]
+        return [self._http.hydrate(User, like) for like in self._payload['likes']]
 
     @cached_slot_property('_cs_media_categories')
     def media_categories(self) -> List[Media]:
-        return [Media(c, self._http) for c in self._payload['mediaCategories']]
+        return [self._http.hydrate(Media, c) for c in self._payload['mediaCategories']]
     
     async def fetch_comments(self) -> List[ThreadComment]:
         data = await self._http.get_thread_comments(self.id)
-        return [ThreadComment(comment, self._http) for comment in data]
+        return [self._http.hydrate(ThreadComment, comment) for comment in data]
 
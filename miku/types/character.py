@@ -13,6 +13,7 @@ __all__ = (
 )
 
 class Character(TypedDict):
+    id: int
     description: str
     favourites: int
     siteUrl: str
@@ -11,7 +11,7 @@ class Name(TypedDict):
     last: str
     full: str
     native: str
-    alternatives: List[str]
+    alternative: List[str]
 
 class FuzzyDate(TypedDict):
     year: Optional[int]
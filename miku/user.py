@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, Optional
 
 from .enums import MediaType, UserNotificationOptionType, UserTitleLanguage, ScoreFormat, ModeratorRole, MediaListStatus
 from .image import Image
@@ -45,6 +45,8 @@ class MediaListTypeOptions:
 class MediaListOptions:
     __slots__ = (
         '_payload',
+        '_cs_anime_list',
+        '_cs_manga_list',
         'score_format',
         'row_order',
     )
@@ -55,11 +57,11 @@ class MediaListOptions:
         self.score_format = ScoreFormat(payload['scoreFormat'])
         self.row_order: str = payload['rowOrder']
 
-    @property
+    @cached_slot_property('_cs_anime_list')
     def anime_list(self) -> MediaListTypeOptions:
         return MediaListTypeOptions(self._payload['animeList'])
 
-    @property
+    @cached_slot_property('_cs_manga_list')
     def manga_list(self) -> MediaListTypeOptions:
         return MediaListTypeOptions(self._payload['mangaList'])
 
@@ -67,6 +69,8 @@ class MediaList(IDComparable):
     __slots__ = (
         '_payload',
         '_http',
+        '_cs_status',
+        '_cs_media',
         'id',
         'media_id',
         'score',
@@ -93,13 +97,14 @@ class MediaList(IDComparable):
     def __repr__(self) -> str:
         return f'<MediaList id={self.id} status={self.status}>'
 
-    @property
+    @cached_slot_property('_cs_status')
     def status(self) -> MediaListStatus:
         return MediaListStatus(self._payload['status'])
 
-    @property
-    def media(self) -> Media:
-        return Media(self._payload['media'], self._http)
+    @cached_slot_property('_cs_media')
+    def media(self) -> Optional[Media]:
+        media = self._payload['media']
+        return self._http.hydrate(Media, media) if media is not None else None
 
 
 class MediaListGroup:
@@ -107,6 +112,7 @@ class MediaListGroup:
         '_payload',
         '_http',
         '_cs_entries',
+        '_cs_status',
         'name',
         'is_custom_list',
         'is_split_custom_list',
@@ -123,13 +129,13 @@ class MediaListGroup:
     def __repr__(self) -> str:
         return f'<MediaListGroup name={self.name!r} entries={len(self.entries)}>'
 
-    @property
+    @cached_slot_property('_cs_status')
     def status(self) -> MediaListStatus:
         return MediaListStatus(self._payload['status'])
 
     @cached_slot_property('_cs_entries')
     def entries(self) -> List[MediaList]:
-        return [MediaList(entry, self._http) for entry in self._payload['entries']]
+        return [self._http.hydrate(MediaList, entry) for entry in self._payload['entries']]
 
 class UserNotificationOption:
     __slots__ = ('enabled', 'type')
@@ -171,28 +177,34 @@ class UserFavourites:
 
     @cached_slot_property('_cs_anime')
     def anime(self) -> List[Anime]:
-        return [Anime(anime, self._http) for anime in self._get_nodes('anime')]
+        return [self._http.hydrate(Anime, anime) for anime in self._get_nodes('anime')]
 
     @cached_slot_property('_cs_manga')
     def manga(self) -> List[Manga]:
-        return [Manga(manga, self._http) for manga in self._get_nodes('manga')]
+        return [self._http.hydrate(Manga, manga) for manga in self._get_nodes('manga')]
 
     @cached_slot_property('_cs_characters')
     def characters(self) -> List[Character]:
-        return [Character(character, self._http) for character in self._get_nodes('characters')]
+        return [self._http.hydrate(Character, character) for character in self._get_nodes('characters')]
 
     @cached_slot_property('_cs_studios')
     def studios(self) -> List[Studio]:
-        return [Studio(studio, self._http) for studio in self._get_nodes('studios')]
+        return [self._http.hydrate(Studio, studio) for studio in self._get_nodes('studios')]
 
     @cached_slot_property('_cs_staff')
     def staff(self) -> List[Staff]:
-        return [Staff(staff, self._http) for staff in self._get_nodes('staff')]
+        return [self._http.hydrate(Staff, staff) for staff in self._get_nodes('staff')]
 
 class User(IDComparable):
     __slots__ = (
         '_payload',
         '_http',
+        '_cs_avatar',
+        '_cs_banner',
+        '_cs_options',
+        '_cs_roles',
+        '_cs_favourites',
+        '_cs_media_list_options',
         'name',
         'id',
         'url',
@@ -206,51 +218,72 @@ class User(IDComparable):
         self._payload = payload
         self._http = http
 
-        self.name: str = payload['name']
-        self.id: int = payload['id']
-        self.url: str = payload['siteUrl']
-        self.about: str = payload['about']
-        self.bans: List[Any] = payload['bans']
-        self.donator_tier: int = payload['donatorTier']
-        self.donator_badge: str = payload['donatorBadge']
+        # Every key is optional since callers can choose which fields get requested.
+        self.name: str = payload.get('name')
+        self.id: int = payload.get('id')
+        self.url: str = payload.get('siteUrl')
+        self.about: str = payload.get('about')
+        self.bans: List[Any] = payload.get('bans')
+        self.donator_tier: int = payload.get('donatorTier')
+        self.donator_badge: str = payload.get('donatorBadge')
 
     def __repr__(self) -> str:
         return '<User id={0.id} name={0.name!r}>'.format(self)
 
-    @property
-    def avatar(self) -> Image:
-        return Image(self._http.session, self._payload['avatar'])
+    @cached_slot_property('_cs_avatar')
+    def avatar(self) -> Optional[Image]:
+        avatar = self._payload.get('avatar')
+        return Image(self._http.session, avatar) if avatar else None
 
-    @property
+    @cached_slot_property('_cs_banner')
     def banner(self) -> Optional[Image]:
-        image = self._payload['bannerImage']
+        image = self._payload.get('bannerImage')
         return Image.from_url(self._http.session, image) if image else None
  
-    @property
-    def options(self) -> UserOptions:
-        return UserOptions(self._payload['options'])
+    @cached_slot_property('_cs_options')
+    def options(self) -> Optional[UserOptions]:
+        options = self._payload.get('options')
+        return UserOptions(options) if options else None
 
-    @property
+    @cached_slot_property('_cs_roles')
     def roles(self) -> List[ModeratorRole]:
-        data = self._payload['moderatorRoles'] or []
+        data = self._payload.get('moderatorRoles') or []
         return [ModeratorRole(role) for role in data]
 
-    @property
+    @cached_slot_property('_cs_favourites')
     def favourites(self) -> UserFavourites:
-        return UserFavourites(self._payload['favourites'], self._http)
+        return UserFavourites(self._payload.get('favourites') or {}, self._http) # type: ignore
 
-    @property
-    def media_list_options(self) -> MediaListOptions:
-        return MediaListOptions(self._payload['mediaListOptions'])
+    @cached_slot_property('_cs_media_list_options')
+    def media_list_options(self) -> Optional[MediaListOptions]:
+        options = self._payload.get('mediaListOptions')
+        return MediaListOptions(options) if options else None
 
     async def fetch_thread(self):
         from .threads import Thread
 
         data = await self._http.get_thread_from_user_id(self.id)
-        return Thread(data, self._http)
+        return self._http.hydrate(Thread, data)
 
     def fetch_media_list(
-        self, *, type: MediaType, per_chunk: int = 50, chunk: int = 0
+        self, *, type: MediaType, per_chunk: int = 50, chunk: int = 0, prefetch: int = 0
     ) -> ChunkPaginator[MediaListGroup]:
-        return self._http.get_media_list_collection(self.id, type.value, per_chunk, chunk)
+        return self._http.get_media_list_collection(self.id, type.value, per_chunk, chunk, prefetch)
+
+    async def stream_media_list(
+        self, *, type: MediaType, per_chunk: int = 500, chunk: int = 0
+    ) -> AsyncIterator[MediaList]:
+        # Entries are handed out as they are received, so only about one of them is ever
+        # held in memory at a time no matter how big the list is.
+        has_next_chunk = True
+        while has_next_chunk:
+            has_next_chunk = False
+
+            async for path, value in self._http.stream_media_list_collection(self.id, type.value, per_chunk, chunk):
+                if path[-1] == 'hasNextChunk':
+                    has_next_chunk = value
+                else:
+                    yield self._http.hydrate(MediaList, value)
+
+            chunk += 1
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import (
     TYPE_CHECKING, 
     Any,
+    Awaitable,
     Callable, 
     Coroutine, 
     Generic,
@@ -25,7 +26,9 @@ __all__ = (
     'IDComparable',
     'CachedSlotProperty',
     'cached_slot_property',
+    'release_payload',
     'maybe_coroutine',
+    'gather_with_concurrency',
     'find',
 )
 
@@ -36,11 +39,22 @@ Coro = Coroutine[Any, Any, T]
 MaybeAwaitable = Union[T, Coroutine[Any, Any, T]]
 
 class IDComparable:
+    __slots__ = ('__weakref__',)
+
     id: Any
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, self.__class__) and self.id == other.id
 
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+class _CachedError:
+    __slots__ = ('error',)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
 class CachedSlotProperty(Generic[T, T_co]):
     def __init__(self, name: str, func: Callable[[T], T_co]) -> None:
         self.name = name
@@ -63,6 +77,9 @@ class CachedSlotProperty(Generic[T, T_co]):
             value = self.func(instance)
             setattr(instance, self.name, value)
 
+        if type(value) is _CachedError:
+            raise value.error.with_traceback(None)
+
         return value
 
 def cached_slot_property(name: str) -> Callable[[Callable[[T], T_co]], CachedSlotProperty[T, T_co]]:
@@ -70,6 +87,28 @@ def cached_slot_property(name: str) -> Callable[[Callable[[T], T_co]], CachedSlo
         return CachedSlotProperty(name, func)
     return decorator
 
+def release_payload(obj: Any) -> None:
+    # Computes every cached slot property up front, including the ones of whatever they
+    # return, after which the raw payload isn't needed anymore.
+    for klass in type(obj).__mro__:
+        for prop in list(vars(klass).values()):
+            if not isinstance(prop, CachedSlotProperty):
+                continue
+
+            try:
+                value = prop.__get__(obj, type(obj))
+            except (KeyError, TypeError, ValueError) as exc:
+                # Usually a field that wasn't selected. The error is kept in the slot so that
+                # accessing the property still raises it once the payload is gone.
+                setattr(obj, prop.name, _CachedError(exc.with_traceback(None)))
+                continue
+
+            for item in value if isinstance(value, list) else (value,):
+                if getattr(item, '_payload', None):
+                    release_payload(item)
+
+    obj._payload = {}
+
 async def maybe_coroutine(func: Callable[P, MaybeAwaitable[T]], *args: P.args, **kwargs: P.kwargs) -> T:
     ret = func(*args, **kwargs)
     if asyncio.iscoroutine(ret):
@@ -77,6 +116,22 @@ async def maybe_coroutine(func: Callable[P, MaybeAwaitable[T]], *args: P.args, *
 
     return ret # type: ignore
     
+async def gather_with_concurrency(limit: int, *aws: Awaitable[T]) -> List[T]:
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def wrapper(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(wrapper(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        raise
+    
 def find(iterable: Iterator[T], predicate: Callable[[T], bool]) -> List[T]:
     return [item for item in iterable if predicate(item)]
 
@@ -0,0 +1,47 @@
+# A local stand-in for the AniList endpoint. Every request body is recorded and answered by
+# `handler`, which gets the decoded body and returns either the JSON to send back or a
+# ready-made response.
+from typing import Any, Awaitable, Callable, Dict, List, Union
+
+from aiohttp import web
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Union[Dict[str, Any], web.Response]]]
+
+HEADERS = {'X-RateLimit-Limit': '90', 'X-RateLimit-Remaining': '89'}
+
+def error(status: int, message: str, **headers: str) -> web.Response:
+    body = {'data': None, 'errors': [{'message': message, 'status': status}]}
+    return web.json_response(body, status=status, headers={**HEADERS, **headers})
+
+class MockServer:
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+        self.requests: List[Dict[str, Any]] = []
+        self.url = ''
+
+    async def __aenter__(self) -> 'MockServer':
+        app = web.Application()
+        app.router.add_post('/', self.view)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+
+        host, port = self.runner.addresses[0][:2]
+        self.url = f'http://{host}:{port}/'
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.runner.cleanup()
+
+    async def view(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.requests.append(payload)
+
+        response = await self.handler(payload)
+        if isinstance(response, web.Response):
+            return response
+
+        return web.json_response(response, headers=HEADERS)
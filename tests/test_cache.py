@@ -0,0 +1,43 @@
+import asyncio
+import os
+
+from miku import AnilistClient
+from miku.cache import SQLiteCache
+
+def test_shared_cache_outlives_a_closed_client(tmp_path: os.PathLike) -> None:
+    async def run() -> None:
+        cache = SQLiteCache(os.path.join(tmp_path, 'cache.db'))
+
+        async with AnilistClient(cache=cache), AnilistClient(cache=cache):
+            await cache.set('key', b'value', 60)
+
+        # Both clients closed the cache, and it works again on next use.
+        assert cache.executor is None
+        assert await cache.get('key') == b'value'
+
+        async with AnilistClient(cache=cache) as first:
+            await first.http.close()
+
+            await cache.set('other', b'value', 60)
+            assert await cache.get('other') == b'value'
+
+        await cache.close()
+
+    asyncio.run(run())
+
+def test_close_while_another_client_uses_the_cache(tmp_path: os.PathLike) -> None:
+    async def run() -> None:
+        cache = SQLiteCache(os.path.join(tmp_path, 'cache.db'))
+        await cache.set('key', b'value', 60)
+
+        values = await asyncio.gather(cache.get('key'), cache.close(), cache.get('key'), cache.get('key'))
+        assert values == [b'value', None, b'value', b'value']
+
+        # The reads queued behind the close reopened the connection on the same thread.
+        assert cache.executor is not None
+        assert await cache.get('key') == b'value'
+
+        await cache.close()
+        assert cache.executor is None
+
+    asyncio.run(run())
@@ -0,0 +1,125 @@
+from typing import Any, Dict, List
+import asyncio
+
+import pytest
+
+from miku import AnilistClient, HTTPException
+from server import MockServer, error
+
+# Scored like AniList would, per id in the document rather than by the client's estimate.
+LIMIT = 500
+MEDIA_COST = 30
+USER_COST = 120
+
+def media(id: int) -> Dict[str, Any]:
+    return {'__typename': 'Media', 'id': id, 'title': {'romaji': f'media {id}', 'english': None, 'native': None}}
+
+def reject(cost: int) -> Any:
+    return error(400, f'Max query complexity should be {LIMIT} but got {cost}.')
+
+async def page(payload: Dict[str, Any]) -> Any:
+    ids: List[int] = payload['variables']['ids']
+    if 5 + MEDIA_COST * len(ids) > LIMIT:
+        return reject(5 + MEDIA_COST * len(ids))
+
+    await asyncio.sleep(0.01)
+    return {'data': {'Page': {'media': [media(id) for id in ids]}}}
+
+async def users(payload: Dict[str, Any]) -> Any:
+    ids = {name: id for name, id in payload['variables'].items() if name.startswith('id')}
+    if USER_COST * len(ids) > LIMIT:
+        return reject(USER_COST * len(ids))
+
+    return {'data': {name.replace('id', 'u'): {'id': id, 'name': f'user{id}'} for name, id in ids.items()}}
+
+def sizes(server: MockServer) -> List[int]:
+    return [len(request['variables']['ids']) for request in server.requests]
+
+def test_bulk_chunks_are_sized_by_the_first_rejection() -> None:
+    async def run() -> None:
+        async with MockServer(page) as server, AnilistClient() as client:
+            client.http.URL = server.url
+
+            result = await client.fetch_media_many(range(100))
+            assert [item.id for item in result] == list(range(100))
+
+            # 50 ids are rejected once, then chunks are cut to what fits.
+            assert sizes(server) == [50, 16, 16, 16, 16, 16, 16, 4]
+
+            server.requests.clear()
+            await client.fetch_media_many(range(100, 200))
+
+            # The next call already knows what the document costs.
+            assert sizes(server) == [16, 16, 16, 16, 16, 16, 4]
+
+    asyncio.run(run())
+
+def test_user_chunks_are_sized_by_the_first_rejection() -> None:
+    async def run() -> None:
+        async with MockServer(users) as server, AnilistClient() as client:
+            client.http.URL = server.url
+
+            result = await client.fetch_users_many(range(10))
+            assert [item.id for item in result] == list(range(10))
+
+            server.requests.clear()
+            await client.fetch_users_many(range(10, 20))
+
+            counts = [len(request['variables']) - 1 for request in server.requests]
+            assert max(counts) * USER_COST <= LIMIT
+            assert sum(counts) == 10
+
+    asyncio.run(run())
+
+def test_batches_are_packed_by_the_first_rejection() -> None:
+    async def handler(payload: Dict[str, Any]) -> Any:
+        roots = {name.split('_')[0] for name in payload['variables'] if name.startswith('a')}
+        if roots and MEDIA_COST * 2 * len(roots) > LIMIT:
+            return reject(MEDIA_COST * 2 * len(roots))
+
+        if not roots:
+            return {'data': {'Media': media(payload['variables']['id'])}}
+
+        return {'data': {root: media(payload['variables'][f'{root}_id']) for root in roots}}
+
+    async def run() -> None:
+        async with MockServer(handler) as server, AnilistClient(batch_window=0.05, max_batch_size=10) as client:
+            client.http.URL = server.url
+
+            await asyncio.gather(*[client.http.get_media(id) for id in range(10)])
+            assert len(server.requests) == 3
+
+            server.requests.clear()
+            result = await asyncio.gather(*[client.http.get_media(id) for id in range(10, 20)])
+
+            assert [item['id'] for item in result] == list(range(10, 20))
+            assert len(server.requests) == 2
+
+    asyncio.run(run())
+
+def test_failed_chunk_cancels_the_others() -> None:
+    started = 0
+
+    async def handler(payload: Dict[str, Any]) -> Any:
+        nonlocal started
+        started += 1
+
+        if started == 2:
+            await asyncio.sleep(0.05)
+            return error(404, 'Not Found.')
+
+        await asyncio.sleep(0.2)
+        return {'data': {'Page': {'media': [media(id) for id in payload['variables']['ids']]}}}
+
+    async def run() -> None:
+        async with MockServer(handler) as server, AnilistClient() as client:
+            client.http.URL = server.url
+            with pytest.raises(HTTPException):
+                await client.fetch_media_many(range(1000), fields='minimal', concurrency=2)
+
+            # The first chunk goes out alone, then two at once. Once one of those fails, the
+            # other is cancelled and the 17 chunks still queued are never sent.
+            await asyncio.sleep(0.3)
+            assert len(server.requests) == 3
+
+    asyncio.run(run())
@@ -0,0 +1,35 @@
+from typing import Any, Dict, List
+import asyncio
+
+from miku import AnilistClient
+from server import MockServer
+
+LAST_PAGE = 7
+
+async def pages(payload: Dict[str, Any]) -> Any:
+    page = payload['variables']['page']
+    info = {'total': LAST_PAGE, 'currentPage': page, 'lastPage': LAST_PAGE, 'hasNextPage': page < LAST_PAGE, 'perPage': 1}
+
+    await asyncio.sleep(0.01)
+    return {'data': {'Page': {'pageInfo': info, 'users': [{'id': page, 'name': f'user{page}'}]}}}
+
+def requested(server: MockServer) -> List[int]:
+    return sorted(request['variables']['page'] for request in server.requests)
+
+def test_prefetch_stops_at_the_last_page() -> None:
+    async def run() -> None:
+        async with MockServer(pages) as server, AnilistClient() as client:
+            client.http.URL = server.url
+
+            ids = []
+            async with client.users('user', per_page=1, prefetch=2) as paginator:
+                async for page in paginator:
+                    ids.extend(user.id for user in page)
+
+                    # Pages past the last one are never requested, not even speculatively.
+                    assert max(requested(server)) <= LAST_PAGE
+
+            assert ids == list(range(1, LAST_PAGE + 1))
+            assert requested(server) == list(range(1, LAST_PAGE + 1))
+
+    asyncio.run(run())
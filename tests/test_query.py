@@ -0,0 +1,36 @@
+from typing import Any
+import asyncio
+import re
+
+import pytest
+
+from miku.http import HTTPHandler
+from miku.query import Query, QueryFields, QueryOperation
+
+def test_no_space_after_closing_braces() -> None:
+    fields = QueryFields('Page', page='$page')
+    fields.add_field('pageInfo', 'total', 'hasNextPage')
+    fields.add_field('media', id_in='$ids').add_field('title', 'romaji')
+    fields.add_field('id')
+
+    query = Query(operation=QueryOperation('query', variables={'$page': 'Int', '$ids': '[Int]'}), fields=fields)
+
+    assert query.build() == (
+        'query($page:Int,$ids:[Int]){Page(page:$page){pageInfo{total hasNextPage}media(id_in:$ids){title{romaji}}id}}'
+    )
+
+@pytest.mark.parametrize('name, type', [
+    ('media_query', 'Media'),
+    ('medias_query', 'Media'),
+    ('users_query', 'User'),
+    ('characters_query', 'Character'),
+])
+def test_builders_are_minified(name: str, type: str) -> None:
+    async def run() -> Any:
+        http = HTTPHandler(asyncio.get_running_loop())
+        return getattr(http, name)(http.select(type, 'full')[0]).compile()
+
+    document = asyncio.run(run())
+
+    assert re.search(r'[{}():,] | [{}():,]', document) is None
+    assert '  ' not in document
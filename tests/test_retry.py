@@ -0,0 +1,58 @@
+from typing import Any, Dict
+import asyncio
+
+import pytest
+
+from miku import AnilistClient, TooManyRequests
+from miku.retry import RetryBudget, RetryPolicy
+from server import MockServer, error
+
+def throttled() -> Any:
+    return error(429, 'Too Many Requests.', **{'Retry-After': '0.01'})
+
+def media(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {'data': {'Media': {'id': payload['variables']['id'], 'title': {'romaji': 'media'}}}}
+
+def policy(**kwargs: Any) -> RetryPolicy:
+    return RetryPolicy(base_delay=0.01, budget=RetryBudget(), **kwargs)
+
+def test_persistent_throttling_gives_up() -> None:
+    async def handler(payload: Dict[str, Any]) -> Any:
+        return throttled()
+
+    async def run() -> None:
+        async with MockServer(handler) as server, AnilistClient(retry_policy=policy(max_throttled_retries=3)) as client:
+            client.http.URL = server.url
+
+            with pytest.raises(TooManyRequests):
+                await client.http.get_media(1, fields='minimal')
+
+            # The first try and then three retries.
+            assert len(server.requests) == 4
+
+    asyncio.run(run())
+
+def test_throttling_does_not_spend_attempts() -> None:
+    async def handler(payload: Dict[str, Any]) -> Any:
+        if len(server.requests) <= 3:
+            return throttled()
+
+        return media(payload)
+
+    server = MockServer(handler)
+
+    async def run() -> None:
+        retry_policy = policy(max_attempts=1, max_throttled_retries=3)
+        async with server, AnilistClient(retry_policy=retry_policy) as client:
+            client.http.URL = server.url
+
+            data = await client.http.get_media(1, fields='minimal')
+
+            assert data['id'] == 1
+            assert len(server.requests) == 4
+
+    asyncio.run(run())
+
+def test_max_throttled_retries_is_validated() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(max_throttled_retries=-1)
@@ -0,0 +1,102 @@
+from typing import Any, Dict
+import asyncio
+
+import pytest
+
+from miku.http import HTTPHandler
+from miku.identity import IdentityMap
+from miku.threads import Thread, ThreadComment
+
+def user(id: int) -> Dict[str, Any]:
+    return {'id': id, 'name': f'user{id}', 'siteUrl': f'https://anilist.co/user/{id}'}
+
+def thread(**fields: Any) -> Dict[str, Any]:
+    payload = {
+        'id': 1,
+        'siteUrl': 'https://anilist.co/forum/thread/1',
+        'title': 'title',
+        'body': 'body',
+        'userId': 1,
+        'replyUserId': None,
+        'replyCommentId': None,
+        'replyCount': 0,
+        'viewCount': 1,
+        'isLocked': False,
+        'isSticky': False,
+        'isSubscribed': False,
+        'isLiked': False,
+        'likeCount': 0,
+        'repliedAt': None,
+        'createdAt': 0,
+        'updatedAt': 0,
+        'categories': [],
+        'mediaCategories': [],
+        'likes': [],
+        'user': user(1),
+        'replyUser': None,
+    }
+    payload.update(fields)
+    return payload
+
+def comment(**fields: Any) -> Dict[str, Any]:
+    payload = {
+        'id': 1,
+        'userId': 1,
+        'threadId': 1,
+        'comment': 'comment',
+        'likeCount': 0,
+        'isLiked': False,
+        'siteUrl': 'https://anilist.co/forum/thread/1/comment/1',
+        'createdAt': 0,
+        'updatedAt': 0,
+        'childComments': [],
+        'likes': [],
+        'thread': thread(),
+        'user': user(1),
+    }
+    payload.update(fields)
+    return payload
+
+MODES = [
+    pytest.param({}, id='default'),
+    pytest.param({'retain_payload': False}, id='slim'),
+    pytest.param({'identity_map': IdentityMap}, id='identity-map'),
+    pytest.param({'retain_payload': False, 'identity_map': IdentityMap}, id='slim-identity-map'),
+]
+
+def hydrate(options: Dict[str, Any], cls: Any, payload: Dict[str, Any]) -> Any:
+    async def run() -> Any:
+        kwargs = dict(options)
+        if 'identity_map' in kwargs:
+            kwargs['identity_map'] = kwargs['identity_map']()
+
+        http = HTTPHandler(asyncio.get_running_loop(), **kwargs)
+        return http.hydrate(cls, payload)
+
+    return asyncio.run(run())
+
+@pytest.mark.parametrize('options', MODES)
+def test_thread_without_reply_user(options: Dict[str, Any]) -> None:
+    obj = hydrate(options, Thread, thread(replyUser=None))
+
+    assert obj.reply_user is None
+    assert obj.owner.id == 1
+
+@pytest.mark.parametrize('options', MODES)
+def test_thread_with_reply_user(options: Dict[str, Any]) -> None:
+    obj = hydrate(options, Thread, thread(replyUserId=2, replyUser=user(2)))
+
+    assert obj.reply_user.id == 2
+
+@pytest.mark.parametrize('options', MODES)
+def test_thread_without_owner(options: Dict[str, Any]) -> None:
+    obj = hydrate(options, Thread, thread(user=None))
+
+    assert obj.owner is None
+
+@pytest.mark.parametrize('options', MODES)
+def test_comment_without_thread_or_user(options: Dict[str, Any]) -> None:
+    obj = hydrate(options, ThreadComment, comment(thread=None, user=None))
+
+    assert obj.thread is None
+    assert obj.user is None